@@ -1,25 +1,40 @@
 from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, HttpUrl
-from typing import Optional, Literal, List
+from typing import Optional, Literal, List, Tuple
+from collections import OrderedDict
+from functools import lru_cache
+import asyncio
+import hashlib
 import json
 import os
 import time # Import time for logging
+import uuid
 from datetime import date # Import date for query parameters
 
 # Cache imports
+import msgpack
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.coder import Coder
 from fastapi_cache.decorator import cache
 
 from services.news_client import NewsClient, NewsAPIException, NewsItem, SentimentResult
-from services.text_extract import extract_and_clean
+from services.text_extract import extract_and_clean, extract_and_clean_many
 
 # Import both Gemini and OpenAI services
 from services.summarizer import GeminiSummarizer
 from services.sentiment import GeminiSentimentAnalyzer
 from services.openai_summarizer import OpenAISummarizer
 from services.openai_sentiment import OpenAISentimentAnalyzer
+from services.combined_analyzer import (
+    GeminiCombinedAnalyzer,
+    OpenAICombinedAnalyzer,
+    CombinedAnalysisException,
+)
+from services.batching import BatchedSummarizer, BatchingAnalyzer
+from services.bulk_analyzer import bulk_analyze
 
 # Generic exceptions
 from services.summarizer import SummarizerException
@@ -32,7 +47,9 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(level
 logger = logging.getLogger(__name__)
 
 
-app = FastAPI()
+# orjson serializes the large /search list responses several times faster
+# than the stdlib json encoder
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Add request timing middleware
 @app.middleware("http")
@@ -59,10 +76,198 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Precomputed neutral fallbacks: these immutable results are returned on every
+# empty-content or failed-analysis path, so build them once at import time.
+# Texts below this can't form a meaningful summary (three bullet points),
+# so the LLM round-trip is skipped and the text is echoed back instead.
+MIN_ANALYZABLE_CHARS = 40
+
+NEUTRAL_NO_CONTENT = SentimentResult(label="Neutral (No Content)", score=3.0)
+NEUTRAL_FAILED = SentimentResult(label="Neutral (Analysis Failed)", score=3.0)
+
+class MsgpackCoder(Coder):
+    """Binary coder for the /search cache.
+
+    msgpack packs the list-of-dicts article payload about twice as fast as
+    JSON and produces smaller values, so a Redis-backed cache hit becomes
+    one GET plus unpackb instead of a JSON round-trip.
+    """
+
+    @classmethod
+    def encode(cls, value) -> bytes:
+        return msgpack.packb(
+            value,
+            use_bin_type=True,
+            default=lambda o: o.to_dict() if hasattr(o, "to_dict") else str(o),
+        )
+
+    @classmethod
+    def decode(cls, value: bytes):
+        return msgpack.unpackb(value, raw=False)
+
+# Shared NewsClient so connection reuse and the client's in-instance caches
+# survive across requests instead of being rebuilt per call. A fresh client is
+# only created when the effective API key changes (e.g. a UI-provided key).
+_news_client: Optional[NewsClient] = None
+
+def get_news_client(api_key: Optional[str] = None) -> NewsClient:
+    """Returns the shared NewsClient, recreating it only when the key changes."""
+    global _news_client
+    if _news_client is None or _news_client.api_key != api_key:
+        _news_client = NewsClient(api_key=api_key)
+    return _news_client
+
+# Shared keep-alive pool for the OpenAI-compatible async clients, created and
+# TLS-warmed at startup so the first /analyze call never pays a handshake.
+_openai_http_client = None
+
+# Analyzer construction is not free: GeminiSummarizer calls genai.configure
+# and the OpenAI services build HTTPX connection pools whose keep-alive
+# connections we want to reuse across requests. Cache instances per client
+# configuration instead of reconstructing them on every /analyze call.
+@lru_cache(maxsize=16)
+def get_analyzers(provider: str, api_key: str, model: Optional[str], api_base: Optional[str]) -> Tuple[object, object]:
+    """Returns the shared (summarizer, sentiment_analyzer) pair for this configuration."""
+    if provider == "gemini":
+        return GeminiSummarizer(api_key=api_key), GeminiSentimentAnalyzer(api_key=api_key)
+    if provider == "openai":
+        return (
+            OpenAISummarizer(api_key=api_key, model=model or "gpt-3.5-turbo", api_base=api_base,
+                             http_client=_openai_http_client),
+            OpenAISentimentAnalyzer(api_key=api_key, model=model or "gpt-3.5-turbo", api_base=api_base,
+                                    http_client=_openai_http_client),
+        )
+    raise ValueError(f"Unsupported LLM provider configured on backend: {provider}")
+
+@lru_cache(maxsize=16)
+def get_combined_analyzer(provider: str, api_key: str, model: Optional[str], api_base: Optional[str]):
+    """Returns the shared combined (summary+sentiment) analyzer for this configuration."""
+    if provider == "gemini":
+        return GeminiCombinedAnalyzer(api_key=api_key)
+    return OpenAICombinedAnalyzer(api_key=api_key, model=model or "gpt-3.5-turbo", api_base=api_base)
+
+# Shared BatchingAnalyzer instances, keyed by client configuration, so the
+# coalescing queue actually spans concurrent requests instead of being
+# rebuilt (empty) per call.
+_batching_analyzers: dict = {}
+
+def _get_batching_analyzer(api_key: str, model: str, api_base: Optional[str]) -> BatchingAnalyzer:
+    """Returns the shared BatchingAnalyzer for this client configuration."""
+    key = (api_key, model, api_base)
+    analyzer = _batching_analyzers.get(key)
+    if analyzer is None:
+        analyzer = _batching_analyzers[key] = BatchingAnalyzer(api_key=api_key, model=model, api_base=api_base)
+    return analyzer
+
+_batched_summarizers: dict = {}
+
+def _get_batched_summarizer(summarizer) -> BatchedSummarizer:
+    """Returns the shared BatchedSummarizer wrapping this summarizer instance."""
+    batched = _batched_summarizers.get(id(summarizer))
+    if batched is None:
+        batched = _batched_summarizers[id(summarizer)] = BatchedSummarizer(summarizer)
+    return batched
+
+# In-process LRU cache for /analyze LLM results, keyed on
+# (provider, model, summary_length, content hash). Repeat analyses of the
+# same article skip the summarize/sentiment LLM calls entirely.
+LLM_CACHE_MAX_ENTRIES = 1024
+LLM_CACHE_PATH = os.path.join("data", "llm_cache.json")
+_llm_cache: "OrderedDict[str, dict]" = OrderedDict()
+
+def _llm_cache_key(provider: str, model: Optional[str], content: str, summary_length: str) -> str:
+    """Builds the LLM result cache key from the call configuration and content hash."""
+    content_hash = hashlib.blake2b(content.encode('utf-8')).hexdigest()
+    return f"{provider}:{model or 'default'}:{summary_length}:{content_hash}"
+
+def _llm_cache_get(key: str) -> Optional[dict]:
+    """Returns the cached entry for key (refreshing LRU order), or None."""
+    entry = _llm_cache.get(key)
+    if entry is not None:
+        _llm_cache.move_to_end(key)
+    return entry
+
+def _llm_cache_put(key: str, summary: str, sentiment: SentimentResult):
+    """Stores a successful analysis result, evicting the oldest entry when full."""
+    _llm_cache[key] = {
+        "summary": summary,
+        "sentiment_label": sentiment.label,
+        "sentiment_score": sentiment.score,
+    }
+    _llm_cache.move_to_end(key)
+    while len(_llm_cache) > LLM_CACHE_MAX_ENTRIES:
+        _llm_cache.popitem(last=False)
+
 @app.on_event("startup")
 async def startup():
-    FastAPICache.init(InMemoryBackend(), prefix="fastapi-cache")
-    logger.info("FastAPI cache initialized with InMemoryBackend.")
+    # A Redis backend shares cache hits across uvicorn workers and survives
+    # restarts; without REDIS_URL each worker keeps its own in-memory cache.
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        try:
+            from fastapi_cache.backends.redis import RedisBackend
+            from redis import asyncio as aioredis
+
+            FastAPICache.init(RedisBackend(aioredis.from_url(redis_url)), prefix="fastapi-cache")
+            logger.info(f"FastAPI cache initialized with RedisBackend ({redis_url}).")
+        except ImportError as e:
+            logger.warning(f"REDIS_URL set but redis backend unavailable ({e}); using InMemoryBackend.")
+            FastAPICache.init(InMemoryBackend(), prefix="fastapi-cache")
+    else:
+        FastAPICache.init(InMemoryBackend(), prefix="fastapi-cache")
+        logger.info("FastAPI cache initialized with InMemoryBackend.")
+    # Pre-open a keep-alive pool for the OpenAI-compatible provider and prime
+    # its TLS session so the first /analyze after startup skips the handshake
+    global _openai_http_client
+    import httpx
+    _openai_http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    )
+    if (os.getenv("LLM_PROVIDER") or "gemini") == "openai" and os.getenv("LLM_API_KEY"):
+        warmup_url = (os.getenv("LLM_API_BASE") or "https://api.openai.com/v1").rstrip("/") + "/models"
+        try:
+            await _openai_http_client.get(warmup_url, timeout=5.0)
+            logger.info(f"Warmed LLM connection pool against {warmup_url}.")
+        except Exception as e:
+            logger.warning(f"LLM connection pool warmup failed (non-fatal): {e}")
+    elif os.getenv("LLM_API_KEY"):
+        # Construct the shared Gemini analyzers now so genai.configure and the
+        # model setup happen at startup, not on the first /analyze request.
+        try:
+            get_analyzers("gemini", os.getenv("LLM_API_KEY"), None, None)
+            logger.info("Warmed Gemini analyzers at startup.")
+        except Exception as e:
+            logger.warning(f"Gemini analyzer warmup failed (non-fatal): {e}")
+    # Prime lxml's libxml2 parser state so the first extraction doesn't pay it
+    try:
+        from lxml import html as _lxml_html
+        _lxml_html.fromstring("<html><body><p>warmup</p></body></html>")
+    except ImportError:
+        pass
+    # Restore the persisted LLM result cache, if any
+    try:
+        with open(LLM_CACHE_PATH, "r", encoding="utf-8") as f:
+            _llm_cache.update(json.load(f))
+        logger.info(f"Loaded {len(_llm_cache)} LLM cache entries from {LLM_CACHE_PATH}.")
+    except FileNotFoundError:
+        pass
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning(f"Could not load LLM cache from {LLM_CACHE_PATH}: {e}")
+
+@app.on_event("shutdown")
+async def shutdown():
+    global _openai_http_client
+    if _openai_http_client is not None:
+        await _openai_http_client.aclose()
+        _openai_http_client = None
+    # Persist the LLM result cache so repeat articles stay cached across restarts
+    try:
+        os.makedirs(os.path.dirname(LLM_CACHE_PATH), exist_ok=True)
+        with open(LLM_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(_llm_cache, f, ensure_ascii=False)
+        logger.info(f"Persisted {len(_llm_cache)} LLM cache entries to {LLM_CACHE_PATH}.")
+    except OSError as e:
+        logger.warning(f"Could not persist LLM cache to {LLM_CACHE_PATH}: {e}")
 
 # Pydantic models for request and response
 class AnalyzeRequest(BaseModel):
@@ -74,6 +279,14 @@ class AnalyzeRequest(BaseModel):
     llm_model: Optional[str] = None
     llm_api_base: Optional[HttpUrl] = None
 
+class BulkAnalyzeRequest(BaseModel):
+    news_urls: List[HttpUrl]
+    summary_length: Literal["short", "medium", "long"] = "medium"
+    # Bulk analysis runs through the OpenAI Batch API, so only OpenAI-compatible settings apply
+    llm_api_key: Optional[str] = None
+    llm_model: Optional[str] = None
+    llm_api_base: Optional[HttpUrl] = None
+
 class AnalyzeResponse(BaseModel):
     title: str
     description: Optional[str]
@@ -90,7 +303,7 @@ async def read_root():
     return {"message": "FastAPI backend is running!"}
 
 @app.get("/search", response_model=List[NewsItem])
-@cache(expire=300) # Cache search results for 5 minutes
+@cache(expire=300, coder=MsgpackCoder) # Cache search results for 5 minutes
 async def search_news_endpoint(
     q: str = Query(..., description="Keyword to search for news articles"),
     from_date: Optional[date] = Query(None, description="Start date for published articles (YYYY-MM-DD)"),
@@ -98,7 +311,7 @@ async def search_news_endpoint(
     language: str = Query("ko", description="Language of the articles (e.g., 'en', 'ko')"),
     sources: Optional[str] = Query(None, description="Comma-separated list of news sources (e.g., 'bbc-news,the-verge')"),
     sort_by: Literal["relevancy", "popularity", "publishedAt"] = Query("publishedAt", description="Order to sort the articles in"),
-    page_size: int = Query(20, ge=1, le=100, description="Number of articles to return (max 100)"),
+    page_size: int = Query(20, ge=1, le=500, description="Number of articles to return (fetched in concurrent pages of 100 above 100)"),
     domains: Optional[str] = Query(None, description="Comma-separated list of domains to search within (e.g., 'bbc.co.uk,techcrunch.com')"), # New parameter
     exclude_domains: Optional[str] = Query(None, description="Comma-separated list of domains to exclude (e.g., 'ynet.co.il')"), # New parameter
     q_in_title: Optional[str] = Query(None, description="Search only for articles where the keyword is in the title"), # New parameter
@@ -114,7 +327,7 @@ async def search_news_endpoint(
             status_code=500, detail="NEWS_API_KEY not configured on the backend server or provided in UI."
         )
     
-    news_client = NewsClient(api_key=news_api_key_used)
+    news_client = get_news_client(api_key=news_api_key_used)
     try:
         articles = news_client.get_news(
             keyword=q,
@@ -138,6 +351,78 @@ async def search_news_endpoint(
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred during news search: {e}")
 
 
+@app.get("/search_and_analyze", response_model=List[NewsItem])
+async def search_and_analyze_endpoint(
+    q: str = Query(..., description="Keyword to search for news articles"),
+    language: str = Query("ko", description="Language of the articles (e.g., 'en', 'ko')"),
+    sort_by: Literal["relevancy", "popularity", "publishedAt"] = Query("publishedAt", description="Order to sort the articles in"),
+    page_size: int = Query(20, ge=1, le=100, description="Number of articles to return"),
+    top_n: int = Query(5, ge=1, le=20, description="Number of top articles to analyze"),
+    summary_length: Literal["short", "medium", "long"] = Query("medium", description="Summary length for analyzed articles"),
+    news_api_key: Optional[str] = Query(None, alias="news_api_key", description="Optional NewsAPI Key, backend env var takes precedence"),
+):
+    # Fused user flow: one request replaces /search followed by N serialized
+    # /analyze calls. The top-N articles are scraped and analyzed with a
+    # bounded async fan-out so provider rate limits are respected.
+    news_api_key_used = os.getenv("NEWS_API_KEY") or news_api_key
+    if not news_api_key_used:
+        raise HTTPException(status_code=500, detail="NEWS_API_KEY not configured on the backend server or provided in UI.")
+    llm_api_key_used = os.getenv("LLM_API_KEY")
+    if not llm_api_key_used:
+        raise HTTPException(status_code=500, detail="LLM_API_KEY not configured on the backend server.")
+    llm_provider_used = os.getenv("LLM_PROVIDER") or "gemini"
+    try:
+        summarizer, sentiment_analyzer = get_analyzers(
+            llm_provider_used, llm_api_key_used, os.getenv("LLM_MODEL"), os.getenv("LLM_API_BASE")
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    news_client = get_news_client(api_key=news_api_key_used)
+    try:
+        articles = news_client.get_news(keyword=q, language=language, sort_by=sort_by, page_size=page_size)
+    except NewsAPIException as e:
+        raise HTTPException(status_code=500, detail=f"News search failed: {e}")
+
+    sem = asyncio.Semaphore(10)
+    # Feeds often syndicate one article under several sources. Keying the
+    # in-flight LLM work by content fingerprint makes duplicates await the
+    # first copy's result instead of issuing their own calls.
+    inflight: dict = {}
+
+    async def analyze_one(article: NewsItem):
+        async with sem:
+            # Scraping uses blocking requests; keep it off the event loop
+            fetched = await asyncio.to_thread(news_client.get_news_from_url, article.url)
+            if fetched is None:
+                return
+            article.content = fetched.content
+            article.processed_content = extract_and_clean(article)
+            if not article.processed_content:
+                return
+            if len(article.processed_content) < MIN_ANALYZABLE_CHARS:
+                article.summary = article.processed_content
+                article.sentiment = NEUTRAL_NO_CONTENT
+                return
+            fingerprint = hashlib.blake2b(article.processed_content.encode('utf-8')).digest()
+            shared = inflight.get(fingerprint)
+            if shared is None:
+                shared = asyncio.gather(
+                    summarizer.summarize_async(article.processed_content, summary_length),
+                    sentiment_analyzer.analyze_async(article.processed_content),
+                    return_exceptions=True,
+                )
+                inflight[fingerprint] = shared
+            summary_result, sentiment_result = await shared
+            if not isinstance(summary_result, BaseException):
+                article.summary = summary_result
+            if not isinstance(sentiment_result, BaseException):
+                article.sentiment = sentiment_result
+
+    await asyncio.gather(*[analyze_one(article) for article in articles[:top_n]])
+    return articles
+
+
 @app.post("/analyze")
 async def analyze_news_endpoint(request: AnalyzeRequest):
     # Prioritize LLM configuration from environment variables, fallback to request body
@@ -149,25 +434,39 @@ async def analyze_news_endpoint(request: AnalyzeRequest):
     llm_model_used = os.getenv("LLM_MODEL") or request.llm_model
     llm_api_base_used = os.getenv("LLM_API_BASE") or (str(request.llm_api_base) if request.llm_api_base else None)
 
-    news_client = NewsClient() # Initialize without API key if only scraping by URL
+    news_client = get_news_client(api_key=os.getenv("NEWS_API_KEY")) # Scraping by URL works without a key
 
     # Based on the provider, instantiate the correct services
-    if llm_provider_used == "gemini":
-        summarizer = GeminiSummarizer(api_key=llm_api_key_used)
-        sentiment_analyzer = GeminiSentimentAnalyzer(api_key=llm_api_key_used)
-    elif llm_provider_used == "openai":
-        summarizer = OpenAISummarizer(
-            api_key=llm_api_key_used,
-            model=llm_model_used or "gpt-3.5-turbo", # Default model
-            api_base=llm_api_base_used,
+    # One fused LLM call for summary+sentiment ships the article text only
+    # once; opt-in since the two-call path keeps independent fallbacks
+    combined_analysis = os.getenv("COMBINED_ANALYSIS_ENABLED", "").lower() in ("1", "true", "yes")
+    # Coalesce bursts of /analyze calls into one JSON-mode LLM request
+    # (OpenAI-compatible providers only); opt-in for the same reason
+    batch_analysis = os.getenv("BATCH_ANALYSIS_ENABLED", "").lower() in ("1", "true", "yes")
+
+    combined_analyzer = None
+    batching_analyzer = None
+    batched_summarizer = None
+    try:
+        summarizer, sentiment_analyzer = get_analyzers(
+            llm_provider_used, llm_api_key_used, llm_model_used, llm_api_base_used
         )
-        sentiment_analyzer = OpenAISentimentAnalyzer(
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if llm_provider_used == "openai" and batch_analysis:
+        batching_analyzer = _get_batching_analyzer(
             api_key=llm_api_key_used,
             model=llm_model_used or "gpt-3.5-turbo", # Default model
             api_base=llm_api_base_used,
         )
-    else:
-        raise HTTPException(status_code=400, detail=f"Unsupported LLM provider configured on backend: {llm_provider_used}")
+    elif llm_provider_used == "gemini" and batch_analysis:
+        # Micro-batch the summary half of Gemini analyses; sentiment still
+        # runs per request so the gather below keeps its independent fallback
+        batched_summarizer = _get_batched_summarizer(summarizer)
+    elif combined_analysis:
+        combined_analyzer = get_combined_analyzer(
+            llm_provider_used, llm_api_key_used, llm_model_used, llm_api_base_used
+        )
 
     try:
         # 1. Get news content from URL
@@ -183,30 +482,101 @@ async def analyze_news_endpoint(request: AnalyzeRequest):
         news_item.processed_content = extract_and_clean(news_item)
         logger.info(f"extract_and_clean took {time.time() - start_clean_content:.2f} seconds.")
         
-        # 3. Summarize
-        if news_item.processed_content:
-            try:
-                start_summarize = time.time()
-                news_item.summary = summarizer.summarize(news_item.processed_content, request.summary_length)
-                logger.info(f"summarizer.summarize took {time.time() - start_summarize:.2f} seconds.")
-            except SummarizerException as e:
-                news_item.summary = f"Summarization failed: {e}"
+        # 3+4. Summarize and analyze sentiment concurrently.
+        # Both LLM calls only depend on processed_content, so running them in
+        # parallel halves the critical path of /analyze. The services expose
+        # native async variants; return_exceptions=True lets each call keep
+        # its own failure fallback.
+        if news_item.processed_content and len(news_item.processed_content) < MIN_ANALYZABLE_CHARS:
+            # Too short to summarize: echo the text, skip both LLM calls
+            news_item.summary = news_item.processed_content
+            news_item.sentiment = NEUTRAL_NO_CONTENT
+        elif news_item.processed_content:
+            cache_key = _llm_cache_key(
+                llm_provider_used, llm_model_used, news_item.processed_content, request.summary_length
+            )
+            cached = _llm_cache_get(cache_key)
+            if cached is not None:
+                logger.info("Returning summarize+sentiment result from LLM cache.")
+                news_item.summary = cached["summary"]
+                news_item.sentiment = SentimentResult(
+                    label=cached["sentiment_label"], score=cached["sentiment_score"]
+                )
+                return AnalyzeResponse.model_construct(
+                    title=news_item.title,
+                    description=news_item.description,
+                    url=news_item.url,
+                    source_name=news_item.source_name,
+                    published_at=news_item.published_at,
+                    summary=news_item.summary,
+                    sentiment_label=news_item.sentiment.label,
+                    sentiment_score=news_item.sentiment.score
+                )
+
+            # Fused single-call path: one round-trip for both fields, falling
+            # back to the two-call path if the combined call or parse fails
+            if combined_analyzer is not None or batching_analyzer is not None:
+                try:
+                    start_llm = time.time()
+                    if batching_analyzer is not None:
+                        news_item.summary, news_item.sentiment = await batching_analyzer.submit(
+                            news_item.processed_content, request.summary_length
+                        )
+                    else:
+                        news_item.summary, news_item.sentiment = await combined_analyzer.analyze_async(
+                            news_item.processed_content, request.summary_length
+                        )
+                    logger.info(f"Combined summarize+sentiment call took {time.time() - start_llm:.2f} seconds.")
+                    _llm_cache_put(cache_key, news_item.summary, news_item.sentiment)
+                    return AnalyzeResponse.model_construct(
+                        title=news_item.title,
+                        description=news_item.description,
+                        url=news_item.url,
+                        source_name=news_item.source_name,
+                        published_at=news_item.published_at,
+                        summary=news_item.summary,
+                        sentiment_label=news_item.sentiment.label,
+                        sentiment_score=news_item.sentiment.score
+                    )
+                except CombinedAnalysisException as e:
+                    logger.warning(f"Combined analysis failed, falling back to separate calls: {e}")
+
+            start_llm = time.time()
+            summary_coro = (
+                batched_summarizer.submit(news_item.processed_content, request.summary_length)
+                if batched_summarizer is not None
+                else summarizer.summarize_async(news_item.processed_content, request.summary_length)
+            )
+            summary_result, sentiment_result = await asyncio.gather(
+                summary_coro,
+                sentiment_analyzer.analyze_async(news_item.processed_content),
+                return_exceptions=True,
+            )
+            logger.info(f"Concurrent summarize+sentiment took {time.time() - start_llm:.2f} seconds.")
+
+            if isinstance(summary_result, SummarizerException):
+                news_item.summary = f"Summarization failed: {summary_result}"
+            elif isinstance(summary_result, BaseException):
+                raise summary_result
+            else:
+                news_item.summary = summary_result
+
+            if isinstance(sentiment_result, SentimentException):
+                news_item.sentiment = NEUTRAL_FAILED
+            elif isinstance(sentiment_result, BaseException):
+                raise sentiment_result
+            else:
+                news_item.sentiment = sentiment_result
+
+            # Only cache fully successful analyses; failures should be retried
+            if not isinstance(summary_result, BaseException) and not isinstance(sentiment_result, BaseException):
+                _llm_cache_put(cache_key, news_item.summary, news_item.sentiment)
         else:
             news_item.summary = "No content to summarize."
-        
-        # 4. Sentiment Analysis
-        if news_item.processed_content:
-            try:
-                start_sentiment = time.time()
-                news_item.sentiment = sentiment_analyzer.analyze(news_item.processed_content)
-                logger.info(f"sentiment_analyzer.analyze took {time.time() - start_sentiment:.2f} seconds.")
-            except SentimentException as e:
-                news_item.sentiment = SentimentResult(label="Neutral (Analysis Failed)", score=3.0) 
-        else:
-            news_item.sentiment = SentimentResult(label="Neutral (No Content)", score=3.0)
+            news_item.sentiment = NEUTRAL_NO_CONTENT
         
         # Prepare response
-        response_data = AnalyzeResponse(
+        response_data = AnalyzeResponse.model_construct(
             title=news_item.title,
             description=news_item.description,
             url=news_item.url,
@@ -218,8 +588,221 @@ async def analyze_news_endpoint(request: AnalyzeRequest):
         )
         return response_data
 
+    except HTTPException:
+        raise # Re-raise HTTPExceptions (e.g. 400 for unfetchable URLs) as-is
     except NewsAPIException as e:
         raise HTTPException(status_code=500, detail=f"An error occurred while processing the news: {e}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"An unknown error occurred: {e}")
 
+
+@app.post("/analyze/stream")
+async def analyze_news_stream_endpoint(request: AnalyzeRequest):
+    # Streaming variant of /analyze: summary deltas are forwarded as SSE
+    # events while they are generated, so the UI can render from
+    # time-to-first-token instead of waiting for the full completion.
+    llm_api_key_used = os.getenv("LLM_API_KEY") or request.llm_api_key
+    if not llm_api_key_used:
+        raise HTTPException(status_code=500, detail="LLM_API_KEY not configured on the backend server or provided in UI.")
+    llm_provider_used = os.getenv("LLM_PROVIDER") or request.llm_provider or "gemini"
+    llm_model_used = os.getenv("LLM_MODEL") or request.llm_model
+    llm_api_base_used = os.getenv("LLM_API_BASE") or (str(request.llm_api_base) if request.llm_api_base else None)
+
+    try:
+        summarizer, sentiment_analyzer = get_analyzers(
+            llm_provider_used, llm_api_key_used, llm_model_used, llm_api_base_used
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    news_client = get_news_client(api_key=os.getenv("NEWS_API_KEY"))
+    try:
+        news_item: Optional[NewsItem] = news_client.get_news_from_url(str(request.news_url))
+    except NewsAPIException as e:
+        # Same mapping as /analyze: fetch failures are a clean error detail
+        raise HTTPException(status_code=500, detail=f"An error occurred while processing the news: {e}")
+    if not news_item:
+        raise HTTPException(status_code=400, detail="Could not fetch news content from the provided URL. Please check the URL or try another one.")
+    news_item.processed_content = extract_and_clean(news_item)
+    content = news_item.processed_content
+
+    def sse_event(event: str, data) -> str:
+        return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    async def event_stream():
+        if not content:
+            yield sse_event("summary", "No content to summarize.")
+            yield sse_event("sentiment", {"sentiment_label": "Neutral (No Content)", "sentiment_score": 3.0})
+            return
+
+        # Sentiment runs concurrently while summary tokens stream out
+        sentiment_task = asyncio.create_task(sentiment_analyzer.analyze_async(content))
+        try:
+            async for delta in summarizer.stream_summary(content, request.summary_length):
+                yield sse_event("summary", delta)
+        except SummarizerException as e:
+            yield sse_event("summary", f"Summarization failed: {e}")
+
+        try:
+            sentiment = await sentiment_task
+        except SentimentException:
+            sentiment = NEUTRAL_FAILED
+        yield sse_event("sentiment", {"sentiment_label": sentiment.label, "sentiment_score": sentiment.score})
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@app.post("/analyze/bulk", response_model=List[AnalyzeResponse])
+async def bulk_analyze_endpoint(request: BulkAnalyzeRequest):
+    # Non-interactive backfill path: provider-side batch scheduling via the
+    # OpenAI Batch API (50% cost, no per-request RTT) instead of concurrency.
+    llm_api_key_used = os.getenv("LLM_API_KEY") or request.llm_api_key
+    if not llm_api_key_used:
+        raise HTTPException(status_code=500, detail="LLM_API_KEY not configured on the backend server or provided in UI.")
+    llm_model_used = os.getenv("LLM_MODEL") or request.llm_model or "gpt-3.5-turbo"
+    llm_api_base_used = os.getenv("LLM_API_BASE") or (str(request.llm_api_base) if request.llm_api_base else None)
+
+    news_client = get_news_client(api_key=os.getenv("NEWS_API_KEY"))
+
+    items: List[NewsItem] = []
+    for url in request.news_urls:
+        try:
+            news_item = news_client.get_news_from_url(str(url))
+        except NewsAPIException as e:
+            raise HTTPException(status_code=400, detail=f"Could not fetch news content from URL: {url} ({e})")
+        if not news_item:
+            raise HTTPException(status_code=400, detail=f"Could not fetch news content from URL: {url}")
+        news_item.processed_content = extract_and_clean(news_item)
+        items.append(news_item)
+
+    try:
+        # The Batch API client is synchronous and polls; keep it off the event loop
+        items = await asyncio.to_thread(
+            bulk_analyze,
+            items,
+            api_key=llm_api_key_used,
+            model=llm_model_used,
+            api_base=llm_api_base_used,
+            summary_length=request.summary_length,
+        )
+    except CombinedAnalysisException as e:
+        raise HTTPException(status_code=500, detail=f"Bulk analysis failed: {e}")
+
+    return [
+        AnalyzeResponse.model_construct(
+            title=item.title,
+            description=item.description,
+            url=item.url,
+            source_name=item.source_name,
+            published_at=item.published_at,
+            summary=item.summary,
+            sentiment_label=item.sentiment.label if item.sentiment else "Neutral (Analysis Failed)",
+            sentiment_score=item.sentiment.score if item.sentiment else 3.0,
+        )
+        for item in items
+    ]
+
+
+
+# In-process registry of non-interactive batch jobs. Gemini's provider-side
+# Batch Mode needs the newer google.genai SDK (not a dependency here), so the
+# bulk path keeps the same submit-then-poll job shape but runs as a background
+# task against the regular async analyzers. Insertion-ordered so the oldest
+# finished jobs (and their result payloads) can be evicted once the registry
+# exceeds its cap, consistent with the bounded caches elsewhere.
+_batch_jobs: "OrderedDict[str, dict]" = OrderedDict()
+BATCH_JOBS_MAX_ENTRIES = 256
+
+def _evict_finished_batch_jobs():
+    """Drops the oldest finished jobs once the registry exceeds its cap."""
+    excess = len(_batch_jobs) - BATCH_JOBS_MAX_ENTRIES
+    if excess <= 0:
+        return
+    finished = [job_id for job_id, job in _batch_jobs.items() if job["status"] != "running"]
+    for job_id in finished[:excess]:
+        del _batch_jobs[job_id]
+
+async def _run_batch_job(job_id: str, urls: List[str], summary_length: str,
+                         provider: str, api_key: str, model: Optional[str], api_base: Optional[str]):
+    """Scrapes, summarizes, and scores every URL of a batch job."""
+    job = _batch_jobs[job_id]
+    try:
+        news_client = get_news_client(api_key=os.getenv("NEWS_API_KEY"))
+        summarizer, sentiment_analyzer = get_analyzers(provider, api_key, model, api_base)
+        items = await news_client.get_news_from_urls(urls)
+        # The whole batch is in hand, so clean every body in one pass up front
+        for item, cleaned in zip(items, extract_and_clean_many(items)):
+            item.processed_content = cleaned
+
+        sem = asyncio.Semaphore(4)
+
+        async def analyze_one(item: NewsItem):
+            if not item.processed_content:
+                item.summary = "No content to summarize."
+                item.sentiment = NEUTRAL_NO_CONTENT
+                return
+            async with sem:
+                summary_result, sentiment_result = await asyncio.gather(
+                    summarizer.summarize_async(item.processed_content, summary_length),
+                    sentiment_analyzer.analyze_async(item.processed_content),
+                    return_exceptions=True,
+                )
+            if isinstance(summary_result, BaseException):
+                item.summary = f"Summarization failed: {summary_result}"
+            else:
+                item.summary = summary_result
+            item.sentiment = NEUTRAL_FAILED if isinstance(sentiment_result, BaseException) else sentiment_result
+
+        await asyncio.gather(*(analyze_one(item) for item in items))
+        job["results"] = [
+            AnalyzeResponse.model_construct(
+                title=item.title,
+                description=item.description,
+                url=item.url,
+                source_name=item.source_name,
+                published_at=item.published_at,
+                summary=item.summary,
+                sentiment_label=item.sentiment.label if item.sentiment else "Neutral (Analysis Failed)",
+                sentiment_score=item.sentiment.score if item.sentiment else 3.0,
+            )
+            for item in items
+        ]
+        job["status"] = "succeeded"
+    except Exception as e:
+        logger.error(f"Batch analysis job {job_id} failed: {e}")
+        job["status"] = "failed"
+        job["error"] = str(e)
+    finally:
+        # The strong task reference is only needed while the job is running
+        job.pop("task", None)
+
+
+@app.post("/analyze/batch")
+async def submit_batch_analysis_endpoint(request: BulkAnalyzeRequest):
+    """Submits a non-interactive batch analysis job and returns its id."""
+    llm_api_key_used = os.getenv("LLM_API_KEY") or request.llm_api_key
+    if not llm_api_key_used:
+        raise HTTPException(status_code=500, detail="LLM_API_KEY not configured on the backend server or provided in UI.")
+    llm_provider_used = os.getenv("LLM_PROVIDER") or "gemini"
+    llm_model_used = os.getenv("LLM_MODEL") or request.llm_model
+    llm_api_base_used = os.getenv("LLM_API_BASE") or (str(request.llm_api_base) if request.llm_api_base else None)
+
+    _evict_finished_batch_jobs()
+    job_id = uuid.uuid4().hex
+    job = _batch_jobs[job_id] = {"status": "running", "results": None, "error": None}
+    # The loop only holds tasks weakly; without a strong reference an
+    # in-flight job could be garbage-collected mid-run and stay "running".
+    job["task"] = asyncio.create_task(_run_batch_job(
+        job_id, [str(url) for url in request.news_urls], request.summary_length,
+        llm_provider_used, llm_api_key_used, llm_model_used, llm_api_base_used,
+    ))
+    return {"job_id": job_id, "status": "running"}
+
+
+@app.get("/analyze/batch/{job_id}")
+async def poll_batch_analysis_endpoint(job_id: str):
+    """Returns the state of a batch job, with results once it succeeded."""
+    job = _batch_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown batch job id: {job_id}")
+    return {"job_id": job_id, "status": job["status"], "error": job["error"], "results": job["results"]}
@@ -0,0 +1,106 @@
+import io
+import logging
+import time
+from typing import List, Optional
+
+import openai
+import orjson
+
+from services.news_client import NewsItem, SentimentResult
+from services.combined_analyzer import (
+    CombinedAnalysisException,
+    _build_combined_prompt,
+    _parse_combined_output,
+)
+
+logger = logging.getLogger(__name__)
+
+#: Terminal states of an OpenAI batch job that mean "no results are coming".
+_FAILED_BATCH_STATUSES = ("failed", "expired", "cancelled")
+
+
+def bulk_analyze(
+    items: List[NewsItem],
+    api_key: str,
+    model: str = "gpt-3.5-turbo",
+    api_base: Optional[str] = None,
+    summary_length: str = "medium",
+    poll_interval: float = 10.0,
+    timeout: float = 3600.0,
+) -> List[NewsItem]:
+    """Analyzes a corpus of articles through the OpenAI Batch API.
+
+    Unlike the interactive /analyze path, this is for non-interactive
+    backfills: one JSONL file with one chat-completion request per article
+    is uploaded, scheduled provider-side (50% cheaper, no per-request RTT),
+    polled until completion, and the results are merged back into the
+    NewsItems. Items without processed_content are skipped; items whose
+    result failed keep summary/sentiment as None.
+    """
+    if not api_key:
+        raise ValueError("API key is required for bulk analysis.")
+
+    pending = [item for item in items if item.processed_content]
+    if not pending:
+        return items
+
+    client = openai.OpenAI(api_key=api_key, base_url=api_base, max_retries=3)
+
+    lines = []
+    for i, item in enumerate(pending):
+        lines.append(orjson.dumps({
+            "custom_id": str(i),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": model,
+                "messages": [
+                    {"role": "system", "content": "You are a helpful assistant that summarizes text and analyzes sentiment."},
+                    {"role": "user", "content": _build_combined_prompt(item.processed_content, summary_length)},
+                ],
+                "temperature": 0.5,
+                "max_tokens": 1024,
+                "response_format": {"type": "json_object"},
+            },
+        }))
+
+    try:
+        input_file = client.files.create(file=io.BytesIO(b"\n".join(lines)), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info(f"Submitted batch {batch.id} with {len(pending)} articles.")
+
+        deadline = time.monotonic() + timeout
+        while batch.status not in ("completed",) + _FAILED_BATCH_STATUSES:
+            if time.monotonic() > deadline:
+                raise CombinedAnalysisException(f"Batch {batch.id} did not complete within {timeout:.0f}s (status: {batch.status}).")
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise CombinedAnalysisException(f"Batch {batch.id} ended with status '{batch.status}'.")
+
+        output = client.files.content(batch.output_file_id).content
+    except CombinedAnalysisException:
+        raise
+    except Exception as e:
+        raise CombinedAnalysisException(f"OpenAI Batch API bulk analysis failed: {e}")
+
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        try:
+            row = orjson.loads(line)
+            item = pending[int(row["custom_id"])]
+            if row.get("error") or row["response"]["status_code"] != 200:
+                logger.warning(f"Batch result for item {row['custom_id']} failed: {row.get('error')}")
+                continue
+            raw_output = row["response"]["body"]["choices"][0]["message"]["content"]
+            item.summary, item.sentiment = _parse_combined_output(raw_output)
+        except (KeyError, IndexError, ValueError, CombinedAnalysisException) as e:
+            logger.warning(f"Could not merge a batch result line: {e}")
+
+    return items
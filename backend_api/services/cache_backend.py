@@ -0,0 +1,137 @@
+import logging
+import os
+import threading
+import time
+from typing import Optional, Protocol
+
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    """요약 캐시의 저장소 프로토콜.
+
+    프로세스 내 메모리(MemoryBackend) 또는 프로세스 간 공유 저장소
+    (RedisBackend)를 같은 비동기 인터페이스 뒤에 둡니다.
+    """
+
+    async def get(self, key: str) -> Optional[str]: ...
+
+    async def set(self, key: str, value: str, ttl: int = 3600) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+
+class MemoryBackend:
+    """TTL이 있는 LRU 기반 인메모리 백엔드. (단일 프로세스 전용)"""
+
+    def __init__(self, maxsize: int = 1024, ttl: int = 3600):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: str, ttl: int = 3600) -> None:
+        # cachetools의 TTL은 캐시 단위이므로 항목별 ttl 인자는 무시됩니다.
+        self._cache[key] = value
+
+    async def delete(self, key: str) -> None:
+        self._cache.pop(key, None)
+
+
+class SqliteBackend:
+    """sqlite 파일 기반 백엔드: 프로세스 재시작 후에도 캐시 적중을 보존합니다.
+
+    어제 요약한 기사를 오늘 다시 요약하면서 Gemini 왕복 비용을 다시 내지
+    않게 합니다. 값이 작고 조회가 sub-ms라 이벤트 루프에서 바로 실행합니다.
+    """
+
+    def __init__(self, path: str):
+        import sqlite3
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at < time.time():
+            # 만료 항목은 조회 시점에 지연 삭제합니다.
+            await self.delete(key)
+            return None
+        return value
+
+    async def set(self, key: str, value: str, ttl: int = 3600) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl),
+            )
+            self._conn.commit()
+
+    async def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+
+class RedisBackend:
+    """redis.asyncio 기반 백엔드: 워커/재시작 간에 캐시 적중을 공유합니다."""
+
+    def __init__(self, url: str):
+        import redis.asyncio as aioredis  # 선택적 의존성: REDIS_URL 설정 시에만 임포트
+        self._redis = aioredis.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            return await self._redis.get(key)
+        except Exception as e:
+            logger.warning(f"Redis cache get failed, treating as miss: {e}")
+            return None
+
+    async def set(self, key: str, value: str, ttl: int = 3600) -> None:
+        try:
+            await self._redis.set(key, value, ex=ttl)
+        except Exception as e:
+            logger.warning(f"Redis cache set failed: {e}")
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self._redis.delete(key)
+        except Exception as e:
+            logger.warning(f"Redis cache delete failed: {e}")
+
+
+def backend_from_env() -> CacheBackend:
+    """환경 변수에 따라 캐시 백엔드를 선택합니다.
+
+    REDIS_URL이 설정되어 있으면 RedisBackend, 아니면 DISK_CACHE_PATH가
+    설정되어 있으면 SqliteBackend, 둘 다 없으면 (또는 초기화에 실패하면)
+    MemoryBackend로 폴백합니다.
+    """
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        try:
+            return RedisBackend(redis_url)
+        except Exception as e:
+            logger.warning(f"Failed to initialize Redis cache backend, using memory: {e}")
+    disk_path = os.getenv("DISK_CACHE_PATH")
+    if disk_path:
+        try:
+            return SqliteBackend(disk_path)
+        except Exception as e:
+            logger.warning(f"Failed to initialize sqlite cache backend, using memory: {e}")
+    return MemoryBackend()
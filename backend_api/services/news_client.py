@@ -1,17 +1,62 @@
+import asyncio
 import time # Added for caching
+import json
+import math
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
 from typing import List, Optional, Literal # Added Literal
+import aiohttp
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from cachetools import TTLCache
+from bs4 import BeautifulSoup, SoupStrainer
 import re
-from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_exception_type, retry_if_exception
 
-@dataclass
+# C 기반 lxml 파서는 html.parser 대비 5~10배 빠르게 트리를 구축합니다.
+# lxml이 설치되지 않은 환경에서는 내장 파서로 폴백합니다.
+try:
+    import lxml  # noqa: F401
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+    _BS_PARSER = "lxml"
+except ImportError:
+    lxml_etree = None
+    lxml_html = None
+    _BS_PARSER = "html.parser"
+
+# 스크래핑에 실제로 쓰는 태그만 트리로 구축합니다. 그 외 태그 노드를
+# 만들지 않으므로 파싱 시간과 메모리 할당이 크게 줄어듭니다.
+_ARTICLE_STRAINER = SoupStrainer(['meta', 'title', 'time', 'article', 'main', 'div', 'p'])
+
+# 본문 후보 탐색용 XPath를 한 번만 컴파일합니다. 태그별 find_all + 정규식 조합과
+# 달리 순회와 클래스 매칭이 전부 C에서 단일 패스로 수행됩니다.
+if lxml_etree is not None:
+    _CLASS_LC = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+    _ARTICLE_XPATH = lxml_etree.XPath(
+        "//*[(self::article or self::main or self::div or self::p) and @class and ("
+        f"contains({_CLASS_LC}, 'content') or contains({_CLASS_LC}, 'article') or "
+        f"contains({_CLASS_LC}, 'body') or contains({_CLASS_LC}, 'post'))]"
+    )
+else:
+    _ARTICLE_XPATH = None
+from urllib3.util import Retry
+
+logger = logging.getLogger(__name__)
+
+# get_news의 변환 루프에서 source가 없는 기사마다 빈 dict를 새로 만들지
+# 않도록 공유하는 싱글턴. (읽기 전용으로만 사용)
+_EMPTY: dict = {}
+
+@dataclass(slots=True)
 class SentimentResult:
     """감성 분석 결과 데이터 클래스"""
     label: str # 긍정 (positive), 중립 (neutral), 부정 (negative)
     score: float # -1.0 (가장 부정) ~ 1.0 (가장 긍정)
 
-@dataclass
+@dataclass(slots=True)
 class NewsItem:
     """뉴스 기사 데이터 클래스"""
     title: str
@@ -24,6 +69,20 @@ class NewsItem:
     summary: Optional[str] = None # 요약 내용을 위한 필드 추가
     sentiment: Optional[SentimentResult] = None # 감성 분석 결과를 위한 필드 추가
 
+    def to_dict(self) -> dict:
+        """직렬화용 딕셔너리를 생성합니다. (재귀 순회하는 asdict보다 빠름)"""
+        return {
+            "title": self.title,
+            "description": self.description,
+            "url": self.url,
+            "source_name": self.source_name,
+            "published_at": self.published_at,
+            "content": self.content,
+            "processed_content": self.processed_content,
+            "summary": self.summary,
+            "sentiment": {"label": self.sentiment.label, "score": self.sentiment.score} if self.sentiment else None,
+        }
+
 class NewsAPIException(Exception):
     """NewsAPI 관련 예외 또는 일반 뉴스 스크래핑 관련 예외"""
     def __init__(self, message, status_code=None):
@@ -34,19 +93,67 @@ class NewsClient:
     """NewsAPI를 호출하거나 URL에서 직접 뉴스를 가져오는 클라이언트"""
     BASE_URL = "https://newsapi.org/v2/everything"
     CACHE_TTL_SECONDS = 300  # Cache Time-To-Live: 5 minutes
+    # 스크래핑 본문 읽기 상한: 광고가 많은 초대형 페이지도 여기까지만 읽습니다.
+    MAX_ARTICLE_BYTES = 1_500_000
+    _STREAM_CHUNK_BYTES = 65536
+    MAX_PAGE_SIZE = 100  # NewsAPI 요청당 최대 기사 수
+    MAX_CONCURRENT_PAGES = 10  # 동시 페이지 요청 수 제한
+    # 핫 패스에서 호출마다 재컴파일/재탐색하지 않도록 클래스 스코프에 공유
+    _ARTICLE_CLASS_RE = re.compile(r'(content|article|body|post)', re.I)
+    _WANTED_META = frozenset({
+        'og:title', 'og:description', 'og:site_name',
+        'og:updated_time', 'article:published_time',
+    })
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None):
         # NewsAPI 키는 선택 사항. URL 스크래핑에는 필요 없음.
         self.api_key = api_key
-        self._news_cache = {}  # Stores cached news items
-        self._cache_timestamps = {} # Stores when each cache entry was made
+        # TTLCache가 만료와 상한(LRU 퇴출)을 함께 관리하므로 별도의
+        # 타임스탬프 dict 없이도 메모리 성장이 512 엔트리로 제한됩니다.
+        self._news_cache = TTLCache(maxsize=512, ttl=self.CACHE_TTL_SECONDS)
+        # 본문 추출에 실패한 URL의 부정 캐시: 같은 나쁜 URL에 대한
+        # 재요청/재파싱/재실패 반복을 막습니다. 일시적 오류는 넣지 않습니다.
+        self._negative_cache = TTLCache(maxsize=1024, ttl=3600)
+        # 호출자가 자체 커넥션 풀을 주입할 수 있게 합니다. (주입된 세션의
+        # 어댑터/헤더 구성은 호출자 책임이므로 그대로 사용)
+        if session is not None:
+            self._session = session
+            return
+        # 연결을 재사용하는 세션: 호출마다 TCP+TLS 핸드셰이크를 다시 하지 않고,
+        # 병렬 스크래핑에 맞춰 커넥션 풀 크기를 키우고, 재시도는 파이썬 레벨
+        # 래퍼 대신 urllib3가 커넥션 풀 안에서 직접 처리하게 합니다.
+        # (429/5xx 상태 재시도 + Retry-After 헤더 준수)
+        self._session = requests.Session()
+        self._session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        })
+        retries = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({'GET'}),
+            respect_retry_after_header=True,
+        )
+        adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retries)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+    def close(self):
+        """세션의 keep-alive 소켓을 반납합니다."""
+        self._session.close()
+
+    def __enter__(self) -> "NewsClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def _extract_article_content(self, soup: BeautifulSoup) -> str:
         """BeautifulSoup 객체에서 기사 본문을 추출합니다."""
         # 흔히 기사 본문이 포함될 수 있는 태그와 클래스를 탐색
         # 더 복잡한 경우 Readability.js 같은 라이브러리 사용을 고려할 수 있음
         for tag in ['article', 'main', 'div', 'p']:
-            contents = soup.find_all(tag, class_=re.compile(r'(content|article|body|post)', re.I))
+            contents = soup.find_all(tag, class_=self._ARTICLE_CLASS_RE)
             if contents:
                 text_parts = [p.get_text(separator='\n', strip=True) for p in contents]
                 full_text = '\n\n'.join(filter(None, text_parts))
@@ -56,61 +163,137 @@ class NewsClient:
         # fallback: 모든 텍스트 가져오기 (헤더, 푸터 등 불필요한 내용 포함될 수 있음)
         return soup.get_text(separator='\n', strip=True)
 
-    @retry(wait=wait_exponential(multiplier=1, min=1, max=10), stop=stop_after_attempt(3),
-           retry=retry_if_exception_type(requests.exceptions.RequestException))
+    def _extract_article_content_lxml(self, tree) -> str:
+        """lxml 트리에서 기사 본문을 추출합니다. (순회/연결 모두 컴파일된 C 경로)"""
+        nodes = _ARTICLE_XPATH(tree)
+        full_text = '\n\n'.join(filter(None, (n.text_content().strip() for n in nodes)))
+        if len(full_text) > 200:  # 최소한의 본문 길이 확인
+            return full_text
+
+        # fallback: 모든 텍스트 가져오기 (헤더, 푸터 등 불필요한 내용 포함될 수 있음)
+        return tree.text_content().strip()
+
     def get_news_from_url(self, url: str) -> Optional[NewsItem]:
         """
         주어진 URL에서 뉴스 기사 본문을 스크래핑하여 NewsItem 객체를 생성합니다.
         """
         # Check cache for web scraped content
-        if url in self._news_cache and \
-           (time.time() - self._cache_timestamps.get(url, 0) < self.CACHE_TTL_SECONDS):
+        cached = self._news_cache.get(url)
+        if cached is not None:
             logger.info(f"Returning web scraped content from cache for URL: {url}")
-            return self._news_cache[url]
+            return cached
+        if url in self._negative_cache:
+            logger.info(f"Skipping URL known to yield no content: {url}")
+            return None
 
         start_time = time.time() # Start timing for web scraping
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=15)
+            # stream=True로 받아 본문을 청크 단위로 읽고 상한에서 끊습니다.
+            # 전체 body를 먼저 메모리에 올리지 않으므로 초대형 페이지에도 안전합니다.
+            response = self._session.get(url, stream=True, timeout=15)
             response.raise_for_status() # HTTP 에러 발생 시 예외 throw
-            logger.info(f"Web scraping GET request for {url} took {time.time() - start_time:.2f} seconds.") # Log request time
+
+            content_type = response.headers.get('Content-Type', '')
+            if content_type and 'html' not in content_type.lower():
+                # PDF 등 HTML이 아닌 문서는 파싱해도 본문이 나오지 않습니다.
+                logger.warning(f"Skipping non-HTML content type '{content_type}' for URL: {url}")
+                response.close()
+                self._negative_cache[url] = True
+                return None
+
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(self._STREAM_CHUNK_BYTES):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > self.MAX_ARTICLE_BYTES:
+                    logger.warning(f"Truncating oversized page ({size} bytes read) for URL: {url}")
+                    break
+            response.close()
+            html = b"".join(chunks)
+            logger.info(f"Web scraping GET request for {url} took {time.time() - start_time:.2f} seconds ({size} bytes).") # Log request time
         except requests.exceptions.Timeout:
             logger.error(f"Web scraping GET request for {url} timed out after {time.time() - start_time:.2f} seconds.") # Log timeout
             raise NewsAPIException(f"URL 요청 시간이 초과되었습니다: {url}")
         except requests.exceptions.RequestException as e:
             # 상태 코드에 따라 NewsAPIException에 status_code 전달
             status_code = e.response.status_code if e.response is not None else None
+            if status_code in (404, 410):
+                # 영구적 실패만 부정 캐시에 기록 (일시적 오류는 재시도 대상)
+                self._negative_cache[url] = True
             logger.error(f"Web scraping GET request for {url} failed after {time.time() - start_time:.2f} seconds with status {status_code}: {e}") # Log failure
             raise NewsAPIException(f"URL 요청 실패: {url} - {e}", status_code=status_code)
         
+        news_item = self._parse_article(url, html)
+        if news_item is None:
+            self._negative_cache[url] = True
+            return None
+
+        # Store in cache
+        self._news_cache[url] = news_item
+
+        return news_item
+
+    def _parse_article(self, url: str, html: bytes) -> Optional[NewsItem]:
+        """스크래핑한 HTML에서 NewsItem을 생성합니다. (동기/비동기 경로 공용)"""
+        if not html:
+            logger.warning(f"Empty response body for {url}.")
+            return None
+
         parse_start_time = time.time() # Start timing for parsing
-        soup = BeautifulSoup(response.text, 'html.parser')
+        if lxml_html is not None:
+            # 빠른 경로: bytes를 lxml C 파서에 직접 넘겨 중간 str 복사본과
+            # BS4 래퍼 객체 생성을 모두 생략합니다.
+            try:
+                tree = lxml_html.fromstring(html)
+            except lxml_etree.ParserError:
+                logger.warning(f"Failed to parse HTML from {url}.")
+                return None
+            # 본문 추출 결과에 스크립트 텍스트가 섞이지 않도록 미리 제거
+            lxml_etree.strip_elements(tree, 'script', 'style', with_tail=False)
 
-        # 메타 태그에서 정보 추출 시도
-        title = soup.find('meta', property='og:title')
-        title = title['content'] if title else soup.title.string if soup.title else '제목 없음'
+            # 메타 태그 정보를 한 번의 순회로 수집
+            metas = {}
+            for m in tree.iter('meta'):
+                prop = m.get('property')
+                if prop in self._WANTED_META:
+                    metas[prop] = m.get('content')
+            title = metas.get('og:title') or tree.findtext('.//title') or '제목 없음'
+            description = metas.get('og:description')
 
-        description = soup.find('meta', property='og:description')
-        description = description['content'] if description else None
-        
-        # 기사 본문 추출 (더 정교한 로직 필요할 수 있음)
-        content_extract_start_time = time.time()
-        content = self._extract_article_content(soup)
-        logger.info(f"Article content extraction from {url} took {time.time() - content_extract_start_time:.2f} seconds.")
-        
-        source_name = soup.find('meta', property='og:site_name')
-        source_name = source_name['content'] if source_name else url.split('/')[2] # 도메인 이름 사용
-
-        published_time = soup.find('meta', property='article:published_time')
-        if not published_time:
-            published_time = soup.find('meta', property='og:updated_time')
-        if not published_time:
-            published_time = soup.find('time')
-            if published_time and published_time.has_attr('datetime'):
-                published_time = published_time['datetime']
-        published_at = published_time['content'] if published_time else datetime.now().isoformat() # ISO 형식으로 변환 시도
+            content_extract_start_time = time.time()
+            content = self._extract_article_content_lxml(tree)
+            logger.info(f"Article content extraction from {url} took {time.time() - content_extract_start_time:.2f} seconds.")
+
+            time_tag = tree.find('.//time')
+            time_datetime = time_tag.get('datetime') if time_tag is not None else None
+        else:
+            # 폴백 경로: lxml이 없으면 기존 BS4 + html.parser 조합을 유지합니다.
+            soup = BeautifulSoup(html, _BS_PARSER, parse_only=_ARTICLE_STRAINER)
+
+            # 메타 태그 정보를 한 번의 순회로 수집 (태그별 find는 트리를 매번 재탐색)
+            metas = {
+                m.get('property'): m.get('content')
+                for m in soup.find_all('meta', property=True)
+                if m.get('property') in self._WANTED_META
+            }
+            title = metas.get('og:title') or (soup.title.string if soup.title else '제목 없음')
+            description = metas.get('og:description')
+
+            # 기사 본문 추출 (더 정교한 로직 필요할 수 있음)
+            content_extract_start_time = time.time()
+            content = self._extract_article_content(soup)
+            logger.info(f"Article content extraction from {url} took {time.time() - content_extract_start_time:.2f} seconds.")
+
+            time_tag = soup.find('time')
+            time_datetime = time_tag['datetime'] if time_tag and time_tag.has_attr('datetime') else None
+
+        source_name = metas.get('og:site_name') or url.split('/')[2] # 도메인 이름 사용
+
+        published_at = (metas.get('article:published_time') or metas.get('og:updated_time')
+                        or time_datetime)
+        if not published_at:
+            published_at = datetime.now().isoformat() # ISO 형식으로 변환 시도
 
         # 최소한의 유효성 검사
         if not content or len(content) < 50: # 너무 짧은 본문은 무시
@@ -123,7 +306,7 @@ class NewsClient:
 
         logger.info(f"Full web scraping and parsing for {url} took {time.time() - parse_start_time:.2f} seconds.") # Log parsing time
 
-        news_item = NewsItem(
+        return NewsItem(
             title=title,
             description=description,
             url=url,
@@ -131,15 +314,86 @@ class NewsClient:
             published_at=published_at,
             content=content,
         )
-        # Store in cache
-        self._news_cache[url] = news_item
-        self._cache_timestamps[url] = time.time()
 
+    async def get_news_from_url_async(self, url: str, session: aiohttp.ClientSession) -> Optional[NewsItem]:
+        """aiohttp 세션으로 기사를 비동기 스크래핑합니다. (동기 버전과 동일한 로직)"""
+        cached = self._news_cache.get(url)
+        if cached is not None:
+            logger.info(f"Returning web scraped content from cache for URL: {url}")
+            return cached
+        if url in self._negative_cache:
+            logger.info(f"Skipping URL known to yield no content: {url}")
+            return None
+
+        start_time = time.time()
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                response.raise_for_status()
+                html = await response.read()
+            logger.info(f"Async web scraping GET request for {url} took {time.time() - start_time:.2f} seconds.")
+        except asyncio.TimeoutError:
+            logger.error(f"Async web scraping GET request for {url} timed out after {time.time() - start_time:.2f} seconds.")
+            raise NewsAPIException(f"URL 요청 시간이 초과되었습니다: {url}")
+        except aiohttp.ClientResponseError as e:
+            if e.status in (404, 410):
+                # 영구적 실패만 부정 캐시에 기록 (일시적 오류는 재시도 대상)
+                self._negative_cache[url] = True
+            logger.error(f"Async web scraping GET request for {url} failed with status {e.status}: {e}")
+            raise NewsAPIException(f"URL 요청 실패: {url} - {e}", status_code=e.status)
+        except aiohttp.ClientError as e:
+            logger.error(f"Async web scraping GET request for {url} failed after {time.time() - start_time:.2f} seconds: {e}")
+            raise NewsAPIException(f"URL 요청 실패: {url} - {e}")
+
+        # BeautifulSoup 파싱은 CPU 작업이므로 이벤트 루프를 막지 않게 스레드로 넘김
+        news_item = await asyncio.get_running_loop().run_in_executor(None, self._parse_article, url, html)
+        if news_item is None:
+            self._negative_cache[url] = True
+            return None
+
+        self._news_cache[url] = news_item
         return news_item
 
-    @retry(wait=wait_exponential(multiplier=1, min=1, max=10), stop=stop_after_attempt(3),
-           retry=(retry_if_exception_type(requests.exceptions.RequestException) |
-                  retry_if_exception(lambda e: isinstance(e, NewsAPIException) and e.status_code == 429)))
+    async def get_news_from_urls(self, urls: List[str]) -> List[NewsItem]:
+        """여러 URL을 동시에 스크래핑하여 성공한 NewsItem 리스트를 반환합니다."""
+        connector = aiohttp.TCPConnector(limit=20)
+        headers = {'User-Agent': self._session.headers['User-Agent']}
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            results = await asyncio.gather(
+                *[self.get_news_from_url_async(url, session) for url in urls],
+                return_exceptions=True,
+            )
+        items = []
+        for url, result in zip(urls, results):
+            if isinstance(result, NewsItem):
+                items.append(result)
+            elif isinstance(result, BaseException):
+                logger.warning(f"Async scraping failed for {url}: {result}")
+        return items
+
+    def _fetch_news_page(self, params: dict) -> List[dict]:
+        """NewsAPI에서 한 페이지를 요청하여 기사 dict 리스트를 반환합니다."""
+        keyword = params.get("q", "")
+        start_time = time.time() # Start timing for NewsAPI call
+        try:
+            response = self._session.get(self.BASE_URL, params=params, timeout=10)
+            response.raise_for_status()
+            logger.info(f"NewsAPI GET request for keyword '{keyword}' took {time.time() - start_time:.2f} seconds.") # Log request time
+        except requests.exceptions.Timeout:
+            logger.error(f"NewsAPI GET request for keyword '{keyword}' timed out after {time.time() - start_time:.2f} seconds.") # Log timeout
+            raise NewsAPIException("NewsAPI 요청 시간이 초과되었습니다. (Timeout)")
+        except requests.exceptions.RequestException as e:
+            if e.response:
+                status_code = e.response.status_code
+                logger.error(f"NewsAPI GET request for keyword '{keyword}' failed after {time.time() - start_time:.2f} seconds with status {status_code}: {e.response.text}") # Log failure
+                if status_code == 429:
+                    raise NewsAPIException("NewsAPI 요청 할당량을 초과했습니다. (429 Too Many Requests)", status_code=status_code)
+                raise NewsAPIException(f"NewsAPI 요청 실패: {status_code} {e.response.text}", status_code=status_code)
+            logger.error(f"NewsAPI GET request for keyword '{keyword}' failed after {time.time() - start_time:.2f} seconds: {e}") # Log failure
+            raise NewsAPIException(f"NewsAPI 요청 중 오류 발생: {e}")
+
+        data = response.json()
+        return data.get("articles", [])
+
     def get_news(
         self, 
         keyword: str,
@@ -173,15 +427,15 @@ class NewsClient:
         cache_key = json.dumps(cache_key_params, sort_keys=True)
 
         # Check cache
-        if cache_key in self._news_cache and \
-           (time.time() - self._cache_timestamps.get(cache_key, 0) < self.CACHE_TTL_SECONDS):
+        cached = self._news_cache.get(cache_key)
+        if cached is not None:
             logger.info(f"Returning news from cache for keyword: {keyword}")
-            return self._news_cache[cache_key]
+            return cached
 
         params = {
             "q": keyword,
             "language": language,
-            "pageSize": page_size,
+            "pageSize": min(page_size, self.MAX_PAGE_SIZE),
             "apiKey": self.api_key,
         }
         if from_date:
@@ -199,37 +453,31 @@ class NewsClient:
         if q_in_title: # New parameter
             params["qInTitle"] = q_in_title
 
-        start_time = time.time() # Start timing for NewsAPI call
-        try:
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
-            response.raise_for_status()
-            logger.info(f"NewsAPI GET request for keyword '{keyword}' took {time.time() - start_time:.2f} seconds.") # Log request time
-        except requests.exceptions.Timeout:
-            logger.error(f"NewsAPI GET request for keyword '{keyword}' timed out after {time.time() - start_time:.2f} seconds.") # Log timeout
-            raise NewsAPIException("NewsAPI 요청 시간이 초과되었습니다. (Timeout)")
-        except requests.exceptions.RequestException as e:
-            if e.response:
-                status_code = e.response.status_code
-                logger.error(f"NewsAPI GET request for keyword '{keyword}' failed after {time.time() - start_time:.2f} seconds with status {status_code}: {e.response.text}") # Log failure
-                if status_code == 429:
-                    raise NewsAPIException("NewsAPI 요청 할당량을 초과했습니다. (429 Too Many Requests)", status_code=status_code)
-                raise NewsAPIException(f"NewsAPI 요청 실패: {status_code} {e.response.text}", status_code=status_code)
-            logger.error(f"NewsAPI GET request for keyword '{keyword}' failed after {time.time() - start_time:.2f} seconds: {e}") # Log failure
-            raise NewsAPIException(f"NewsAPI 요청 중 오류 발생: {e}")
-
-        data = response.json()
-        articles_data = data.get("articles", [])
+        if page_size <= self.MAX_PAGE_SIZE:
+            articles_data = self._fetch_news_page(params)
+        else:
+            # NewsAPI는 요청당 100건까지만 반환하므로 필요한 페이지를 동시에 요청
+            pages = math.ceil(page_size / self.MAX_PAGE_SIZE)
+            with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_PAGES) as executor:
+                page_results = list(executor.map(
+                    lambda p: self._fetch_news_page({**params, "page": p}),
+                    range(1, pages + 1)
+                ))
+            articles_data = [article for page in page_results for article in page]
+            articles_data = articles_data[:page_size]
 
         if not articles_data:
             return []
 
-        # Convert raw dicts to NewsItem objects
+        # Convert raw dicts to NewsItem objects. 루프 바깥에서 로컬에
+        # 바인딩해 반복마다의 LOAD_GLOBAL과 기본값 {} 할당을 없앱니다.
+        NI = NewsItem
         news_items = [
-            NewsItem(
+            NI(
                 title=article.get("title", ""),
                 description=article.get("description"),
                 url=article.get("url", ""),
-                source_name=article.get("source", {}).get("name", ""),
+                source_name=(article.get("source") or _EMPTY).get("name", ""),
                 published_at=article.get("publishedAt", ""),
                 content=article.get("content"),
             )
@@ -238,7 +486,6 @@ class NewsClient:
 
         # Store in cache
         self._news_cache[cache_key] = news_items
-        self._cache_timestamps[cache_key] = time.time()
 
         return news_items
 
@@ -249,14 +496,34 @@ def save_to_json(news_items: List[NewsItem], directory: str, filename: str):
         os.makedirs(directory)
 
     filepath = os.path.join(directory, filename)
-    
-    # dataclass의 asdict를 사용하여 모든 필드를 딕셔너리로 변환
-    # 이때, 중첩된 dataclass (SentimentResult)도 자동으로 변환됩니다.
-    dict_items = [asdict(item) for item in news_items]
-    
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(dict_items, f, ensure_ascii=False, indent=4)
-        
+
+    # orjson은 C 구현이라 json.dumps보다 한 자릿수 빠르고 UTF-8을 그대로 기록합니다.
+    # 전체 리스트를 딕셔너리 리스트로 복제해 두 번 들고 있지 않도록 항목
+    # 단위로 직렬화해 바로 파일에 흘려보냅니다. (JSON 배열 스트리밍 패턴)
+    with open(filepath, "wb") as f:
+        f.write(b"[\n")
+        for i, item in enumerate(news_items):
+            if i:
+                f.write(b",\n")
+            f.write(orjson.dumps(item.to_dict(), option=orjson.OPT_INDENT_2))
+        f.write(b"\n]")
+
+    return filepath
+
+
+def save_to_ndjson(news_items: List[NewsItem], directory: str, filename: str):
+    """뉴스 아이템 리스트를 한 줄에 하나씩 NDJSON 파일로 저장합니다."""
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    filepath = os.path.join(directory, filename)
+
+    # orjson은 UTF-8 bytes를 바로 내놓으므로 바이너리 모드로 기록합니다.
+    with open(filepath, "wb") as f:
+        for item in news_items:
+            f.write(orjson.dumps(item.to_dict()))
+            f.write(b"\n")
+
     return filepath
 
 
@@ -0,0 +1,61 @@
+import asyncio
+import time
+from collections import deque
+
+
+class GeminiLimiter:
+    """Gemini 호출을 위한 슬라이딩 윈도우 비율 제한기.
+
+    사후에 429를 맞고 재시도하는 대신, RPM/TPM/RPD 쿼터를 선제적으로
+    추적해 한도에 도달하면 호출 전에 기다립니다. 선언된 쿼터의 80%만
+    사용해 다른 프로세스나 추정 오차에 대한 안전 여유를 둡니다.
+    토큰 수는 호출자가 대략 len(text)//4로 추정해 전달합니다.
+    """
+
+    def __init__(self, rpm: int = 30, tpm: int = 1_000_000, rpd: int = 1500,
+                 safety_margin: float = 0.8):
+        self.rpm = max(1, int(rpm * safety_margin))
+        self.tpm = max(1, int(tpm * safety_margin))
+        self.rpd = max(1, int(rpd * safety_margin))
+        self._requests: deque = deque()        # 최근 1분의 요청 시각
+        self._tokens: deque = deque()          # 최근 1분의 (시각, 토큰 수)
+        self._token_total = 0                  # _tokens의 합계 (매번 재합산 방지)
+        self._daily: deque = deque()           # 최근 24시간의 요청 시각
+        self._lock = asyncio.Lock()
+
+    def _prune(self, now: float):
+        """윈도우를 벗어난 기록을 제거합니다."""
+        minute_ago = now - 60
+        while self._requests and self._requests[0] <= minute_ago:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= minute_ago:
+            self._token_total -= self._tokens.popleft()[1]
+        day_ago = now - 86400
+        while self._daily and self._daily[0] <= day_ago:
+            self._daily.popleft()
+
+    def _wait_time(self, now: float, tokens_estimate: int) -> float:
+        """다음 호출이 가능해질 때까지 기다려야 하는 시간을 계산합니다."""
+        wait = 0.0
+        if len(self._requests) >= self.rpm:
+            wait = max(wait, self._requests[0] + 60 - now)
+        if self._tokens and self._token_total + tokens_estimate > self.tpm:
+            wait = max(wait, self._tokens[0][0] + 60 - now)
+        if len(self._daily) >= self.rpd:
+            wait = max(wait, self._daily[0] + 86400 - now)
+        return wait
+
+    async def acquire(self, tokens_estimate: int = 0):
+        """쿼터에 여유가 생길 때까지 기다린 뒤 호출 한 건을 기록합니다."""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._prune(now)
+                wait = self._wait_time(now, tokens_estimate)
+                if wait <= 0:
+                    self._requests.append(now)
+                    self._tokens.append((now, tokens_estimate))
+                    self._token_total += tokens_estimate
+                    self._daily.append(now)
+                    return
+            await asyncio.sleep(wait)
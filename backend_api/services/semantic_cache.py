@@ -0,0 +1,92 @@
+import logging
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """임베딩 코사인 유사도 기반의 의미론적 캐시.
+
+    동일한 사건을 다룬 서로 다른 기사처럼, 본문이 거의 같지만 완전히
+    일치하지는 않는 텍스트에 대해 저장된 결과를 재사용합니다.
+    임베딩 계산에 실패하면 캐시는 조용히 미스로 처리됩니다.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], Sequence[float]],
+        threshold: float = 0.92,
+        max_entries: int = 256,
+        prefix_chars: int = 2000,
+    ):
+        self._embed_fn = embed_fn
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.prefix_chars = prefix_chars
+        # namespace (예: summary_length) -> 정규화된 임베딩 벡터 리스트와 결과 값 리스트
+        self._embeddings: Dict[str, List[np.ndarray]] = {}
+        self._values: Dict[str, List[str]] = {}
+        # 조회마다 vstack으로 행렬을 다시 쌓지 않도록 네임스페이스별로 캐시
+        self._matrix_cache: Dict[str, np.ndarray] = {}
+        # get() 직후 put()에서 임베딩을 재계산하지 않도록 마지막 쿼리를 보관
+        self._last_query: Optional[Tuple[str, str, np.ndarray]] = None
+        # 임베딩 호출이 한 번이라도 실패하면 (키/네트워크 미구성 등) 캐시를 비활성화
+        self._disabled = False
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """텍스트 접두부의 정규화된 임베딩 벡터를 반환합니다. 실패 시 None."""
+        if self._disabled:
+            return None
+        try:
+            vector = np.asarray(self._embed_fn(text[:self.prefix_chars]), dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Semantic cache embedding failed, disabling semantic cache: {e}")
+            self._disabled = True
+            return None
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return vector / norm
+
+    def get(self, text: str, namespace: str = "") -> Optional[str]:
+        """가장 유사한 캐시 항목이 임계값 이상이면 그 값을 반환합니다."""
+        query = self._embed(text)
+        if query is None:
+            return None
+        self._last_query = (namespace, text, query)
+
+        vectors = self._embeddings.get(namespace)
+        if not vectors:
+            return None
+
+        matrix = self._matrix_cache.get(namespace)
+        if matrix is None:
+            matrix = np.vstack(vectors)
+            self._matrix_cache[namespace] = matrix
+        similarities = matrix @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.threshold:
+            return self._values[namespace][best]
+        return None
+
+    def put(self, text: str, value: str, namespace: str = ""):
+        """텍스트의 임베딩과 결과 값을 저장합니다."""
+        # 직전 get()과 동일한 텍스트라면 임베딩을 재사용
+        if self._last_query and self._last_query[0] == namespace and self._last_query[1] == text:
+            embedding = self._last_query[2]
+        else:
+            embedding = self._embed(text)
+        if embedding is None:
+            return
+
+        vectors = self._embeddings.setdefault(namespace, [])
+        values = self._values.setdefault(namespace, [])
+        vectors.append(embedding)
+        values.append(value)
+        self._matrix_cache.pop(namespace, None)  # 스택된 행렬 무효화
+        # 가장 오래된 항목부터 제거하여 크기를 제한
+        while len(vectors) > self.max_entries:
+            vectors.pop(0)
+            values.pop(0)
@@ -1,39 +1,79 @@
 import re
-from typing import Optional
+from typing import List, Optional
 from bs4 import BeautifulSoup
 from services.news_client import NewsItem # NewsItem을 가져와서 사용합니다.
 
+# 태그 제거만 필요할 때는 BeautifulSoup의 파이썬 래퍼 계층을 거치지 않고
+# lxml C 파서의 text_content()를 직접 호출합니다. (없으면 BS4로 폴백)
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+# 태그가 거의 없는 짧은 조각용 단순 태그 제거 패턴 (파서 기동 비용 회피)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# 핫 패스에서 호출마다 re 모듈 캐시를 조회하지 않도록 미리 컴파일합니다.
+_WS_RE = re.compile(r'\s+')
+
+# 공백 정규화 + 절단 융합 패스용 단어 토큰 패턴
+_WORD_RE = re.compile(r'\S+')
+
 class TextExtractionError(Exception):
     """텍스트 추출 및 정제 관련 예외"""
     pass
 
+def canonicalize(text: str) -> str:
+    """캐시 키 계산용 정규형을 만듭니다.
+
+    공백 차이나 대소문자만 다른 동일 기사가 서로 다른 캐시 키를 만들지
+    않도록, 연속 공백을 단일 공백으로 접고 양끝을 다듬은 뒤 소문자화합니다.
+    """
+    if not text:
+        return ""
+    return _WS_RE.sub(' ', text).strip().lower()
+
 def _remove_html_tags(text: str) -> str:
     """HTML 태그를 제거하고 텍스트를 추출합니다."""
     if not text:
         return ""
+    if '<' not in text:
+        # 태그가 아예 없으면 파서를 기동할 이유가 없습니다.
+        return text
+    if len(text) < 128:
+        # 아주 짧은 조각은 정규식 제거가 파서 기동보다 쌉니다.
+        return _TAG_RE.sub('', text)
+    if lxml_html is not None:
+        try:
+            return lxml_html.fromstring(text).text_content()
+        except Exception:
+            pass  # 비정상 마크업은 더 관대한 BS4 경로로 폴백
     soup = BeautifulSoup(text, "lxml") # 'lxml' 파서를 사용하여 더 견고하게 파싱
     return soup.get_text()
 
-def _remove_whitespace(text: str) -> str:
-    """불필요한 공백 (여러 공백, 줄바꿈)을 제거하고 단일 공백으로 대체합니다."""
-    if not text:
-        return ""
-    text = re.sub(r'\s+', ' ', text) # 여러 공백을 단일 공백으로
-    text = text.strip() # 양쪽 끝 공백 제거
-    return text
+def _clean_and_truncate(text: str, max_length: int) -> str:
+    """공백 정규화와 길이 절단을 한 번의 스캔으로 수행합니다.
 
-def _truncate_text(text: str, max_length: int) -> str:
-    """텍스트를 지정된 최대 길이로 자릅니다."""
+    공백으로 전체를 치환한 중간 문자열을 만들고 다시 자르는 대신, 단어
+    단위로 모으다가 max_length에 도달하면 즉시 멈춥니다. 아주 긴 본문은
+    앞부분만 스캔하고 끝나므로 O(max_length)에 가깝습니다. 기존과 같이
+    단어 중간에서 자르지 않고, 잘린 경우 '...'를 덧붙입니다.
+    """
     if not text:
         return ""
-    if len(text) > max_length:
-        # 단어 중간에 잘리지 않도록 마지막 공백을 찾아 자릅니다.
-        truncated = text[:max_length]
-        last_space = truncated.rfind(' ')
-        if last_space != -1:
-            truncated = truncated[:last_space]
-        return truncated + "..."
-    return text
+    words = []
+    total = 0
+    for m in _WORD_RE.finditer(text):
+        word = m.group()
+        added = len(word) + (1 if words else 0)
+        if total + added > max_length:
+            if not words:
+                # 공백 없는 초장문(단일 토큰)은 기존처럼 하드 컷
+                words.append(word[:max_length])
+            return ' '.join(words) + "..."
+        words.append(word)
+        total += added
+    return ' '.join(words)
 
 def extract_and_clean(news_item: NewsItem, max_length: int = 4000) -> str:
     """
@@ -52,9 +92,7 @@ def extract_and_clean(news_item: NewsItem, max_length: int = 4000) -> str:
     if original_content:
         try:
             cleaned_text = _remove_html_tags(original_content)
-            cleaned_text = _remove_whitespace(cleaned_text)
-            final_text = _truncate_text(cleaned_text, max_length)
-            return final_text
+            return _clean_and_truncate(cleaned_text, max_length)
         except Exception as e:
             # HTML 파싱 또는 정제 중 오류 발생 시, 대체 텍스트로 폴백
             print(f"Error during text cleaning for '{news_item.title}': {e}")
@@ -65,4 +103,15 @@ def extract_and_clean(news_item: NewsItem, max_length: int = 4000) -> str:
     if news_item.description:
         alt_text += news_item.description + " "
     alt_text += f"출처: {news_item.source_name}."
-    return _truncate_text(_remove_whitespace(alt_text), max_length)
\ No newline at end of file
+    return _clean_and_truncate(alt_text, max_length)
+
+
+def extract_and_clean_many(news_items: List[NewsItem], max_length: int = 4000) -> List[str]:
+    """여러 NewsItem의 본문을 입력 순서대로 정제합니다.
+
+    파서/정규식 등 무거운 상태는 이미 모듈 수준에서 한 번만 만들어지므로
+    타이트한 루프 하나로 충분합니다. ProcessPoolExecutor 분산은 기사당
+    수 KB 규모에서 NewsItem 직렬화 비용이 파싱 이득을 상회해 채택하지
+    않았습니다.
+    """
+    return [extract_and_clean(item, max_length) for item in news_items]
@@ -0,0 +1,36 @@
+import pytest
+from unittest.mock import MagicMock
+
+
+@pytest.fixture(scope="session")
+def make_gemini_response():
+    """Factory for Gemini response mocks (parts/text/prompt_feedback/candidates).
+
+    The same mock tree was rebuilt inline in every Gemini test; building it
+    through one factory keeps the tests to a single line of setup each.
+    """
+    def _make(text=None, block_reason=None, finish_reason='STOP'):
+        mock_response = MagicMock()
+        if text is None:
+            mock_response.parts = []
+        else:
+            mock_part = MagicMock()
+            mock_part.text = text
+            mock_response.parts = [mock_part]
+            mock_response.text = text
+        mock_response.prompt_feedback = MagicMock(block_reason=block_reason) if block_reason else None
+        mock_response.candidates = [MagicMock(finish_reason=finish_reason)]
+        return mock_response
+    return _make
+
+
+@pytest.fixture
+def mock_generate_content(monkeypatch):
+    """Patches GenerativeModel.generate_content once per test.
+
+    Replaces the per-test @patch decorator stacking; tests set return_value
+    or side_effect on the yielded mock directly.
+    """
+    mock = MagicMock()
+    monkeypatch.setattr("google.generativeai.GenerativeModel.generate_content", mock)
+    return mock
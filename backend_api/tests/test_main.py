@@ -1,14 +1,25 @@
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 import os
 from datetime import date # Added for advanced filtering tests
 
 # Import the main app instance from your application
 from main import app, AnalyzeRequest, AnalyzeResponse, NewsItem, NewsAPIException, HTTPException, SummarizerException, SentimentException
+from main import get_analyzers, get_combined_analyzer
+import main
 
 client = TestClient(app)
 
+@pytest.fixture(autouse=True)
+def clear_analyzer_caches():
+    """The analyzer factories cache instances, so clear them between tests
+    to let per-test patches of the service classes take effect."""
+    get_analyzers.cache_clear()
+    get_combined_analyzer.cache_clear()
+    main.__dict__['_news_client'] = None  # singleton must not leak a previous test's mock
+    yield
+
 @pytest.fixture(autouse=True)
 def mock_env_vars():
     """Fixture to mock environment variables for API keys."""
@@ -55,7 +66,7 @@ def test_read_root():
     assert response.json() == {"message": "FastAPI backend is running!"}
 
 ### Test cases for /search endpoint ###
-@patch('main.NewsClient')
+@patch('main.NewsClient', autospec=True)
 def test_search_news_success(mock_news_client_class, mock_news_item):
     mock_news_client_instance = mock_news_client_class.return_value
     mock_news_client_instance.get_news.return_value = [mock_news_item]
@@ -73,7 +84,7 @@ def test_search_news_success(mock_news_client_class, mock_news_item):
         page_size=20
     )
 
-@patch('main.NewsClient')
+@patch('main.NewsClient', autospec=True)
 def test_search_news_advanced_filters(mock_news_client_class, mock_news_item):
     mock_news_client_instance = mock_news_client_class.return_value
     mock_news_client_instance.get_news.return_value = [mock_news_item]
@@ -109,7 +120,7 @@ def test_search_news_no_news_api_key(mock_os_getenv):
     assert response.status_code == 500
     assert response.json() == {"detail": "NEWS_API_KEY not configured on the backend server or provided in UI."}
 
-@patch('main.NewsClient')
+@patch('main.NewsClient', autospec=True)
 def test_search_news_exception(mock_news_client_class):
     mock_news_client_instance = mock_news_client_class.return_value
     mock_news_client_instance.get_news.side_effect = NewsAPIException("Search failed")
@@ -119,7 +130,7 @@ def test_search_news_exception(mock_news_client_class):
     assert response.json() == {"detail": "News search failed: Search failed"}
 
 ### Test cases for /analyze endpoint ###
-@patch('main.NewsClient')
+@patch('main.NewsClient', autospec=True)
 @patch('main.os.getenv')
 def test_analyze_news_no_llm_api_key(mock_os_getenv, mock_news_client_class):
     mock_os_getenv.side_effect = lambda key, default=None: {
@@ -134,7 +145,7 @@ def test_analyze_news_no_llm_api_key(mock_os_getenv, mock_news_client_class):
     assert response.status_code == 500
     assert response.json() == {"detail": "LLM_API_KEY not configured on the backend server or provided in UI."}
 
-@patch('main.NewsClient')
+@patch('main.NewsClient', autospec=True)
 @patch('main.os.getenv')
 def test_analyze_news_unsupported_llm_provider(mock_os_getenv, mock_news_client_class):
     mock_os_getenv.side_effect = lambda key, default=None: {
@@ -148,9 +159,9 @@ def test_analyze_news_unsupported_llm_provider(mock_os_getenv, mock_news_client_
     assert response.status_code == 400
     assert response.json() == {"detail": "Unsupported LLM provider configured on backend: unsupported_provider"}
 
-@patch('main.NewsClient')
-@patch('main.GeminiSummarizer')
-@patch('main.GeminiSentimentAnalyzer')
+@patch('main.NewsClient', autospec=True)
+@patch('main.GeminiSummarizer', autospec=True)
+@patch('main.GeminiSentimentAnalyzer', autospec=True)
 def test_analyze_news_gemini_success(mock_sentiment_analyzer_class, mock_summarizer_class, mock_news_client_class, mock_news_item, mock_analysis_response, mock_env_vars):
     # Mock NewsClient.get_news_from_url
     mock_news_client_instance = mock_news_client_class.return_value
@@ -160,11 +171,13 @@ def test_analyze_news_gemini_success(mock_sentiment_analyzer_class, mock_summari
     with patch('main.extract_and_clean', return_value=mock_news_item.processed_content):
         # Mock Summarizer
         mock_summarizer_instance = mock_summarizer_class.return_value
-        mock_summarizer_instance.summarize.return_value = mock_analysis_response.summary
+        mock_summarizer_instance.summarize_async = AsyncMock()
+        mock_summarizer_instance.summarize_async.return_value = mock_analysis_response.summary
 
         # Mock Sentiment Analyzer
         mock_sentiment_analyzer_instance = mock_sentiment_analyzer_class.return_value
-        mock_sentiment_analyzer_instance.analyze.return_value = mock_news_item.sentiment
+        mock_sentiment_analyzer_instance.analyze_async = AsyncMock()
+        mock_sentiment_analyzer_instance.analyze_async.return_value = mock_news_item.sentiment
 
         request_payload = {"news_url": "http://test.com/news", "summary_length": "short"}
         response = client.post("/analyze", json=request_payload)
@@ -172,12 +185,12 @@ def test_analyze_news_gemini_success(mock_sentiment_analyzer_class, mock_summari
         assert response.status_code == 200
         assert response.json() == mock_analysis_response.model_dump()
         mock_news_client_instance.get_news_from_url.assert_called_once_with("http://test.com/news")
-        mock_summarizer_instance.summarize.assert_called_once_with(mock_news_item.processed_content, "short")
-        mock_sentiment_analyzer_instance.analyze.assert_called_once_with(mock_news_item.processed_content)
+        mock_summarizer_instance.summarize_async.assert_called_once_with(mock_news_item.processed_content, "short")
+        mock_sentiment_analyzer_instance.analyze_async.assert_called_once_with(mock_news_item.processed_content)
 
-@patch('main.NewsClient')
-@patch('main.OpenAISummarizer')
-@patch('main.OpenAISentimentAnalyzer')
+@patch('main.NewsClient', autospec=True)
+@patch('main.OpenAISummarizer', autospec=True)
+@patch('main.OpenAISentimentAnalyzer', autospec=True)
 @patch('main.os.getenv')
 def test_analyze_news_openai_success(mock_os_getenv, mock_sentiment_analyzer_class, mock_summarizer_class, mock_news_client_class, mock_news_item, mock_analysis_response):
     # Ensure LLM_PROVIDER is set to openai for this test
@@ -196,11 +209,13 @@ def test_analyze_news_openai_success(mock_os_getenv, mock_sentiment_analyzer_cla
     with patch('main.extract_and_clean', return_value=mock_news_item.processed_content):
         # Mock Summarizer
         mock_summarizer_instance = mock_summarizer_class.return_value
-        mock_summarizer_instance.summarize.return_value = mock_analysis_response.summary
+        mock_summarizer_instance.summarize_async = AsyncMock()
+        mock_summarizer_instance.summarize_async.return_value = mock_analysis_response.summary
 
         # Mock Sentiment Analyzer
         mock_sentiment_analyzer_instance = mock_sentiment_analyzer_class.return_value
-        mock_sentiment_analyzer_instance.analyze.return_value = mock_news_item.sentiment
+        mock_sentiment_analyzer_instance.analyze_async = AsyncMock()
+        mock_sentiment_analyzer_instance.analyze_async.return_value = mock_news_item.sentiment
 
         request_payload = {"news_url": "http://test.com/news", "summary_length": "short"}
         response = client.post("/analyze", json=request_payload)
@@ -208,12 +223,12 @@ def test_analyze_news_openai_success(mock_os_getenv, mock_sentiment_analyzer_cla
         assert response.status_code == 200
         assert response.json() == mock_analysis_response.model_dump()
         mock_news_client_instance.get_news_from_url.assert_called_once_with("http://test.com/news")
-        mock_summarizer_instance.summarize.assert_called_once_with(mock_news_item.processed_content, "short")
-        mock_sentiment_analyzer_instance.analyze.assert_called_once_with(mock_news_item.processed_content)
-        mock_summarizer_class.assert_called_once_with(api_key="test_llm_api_key", model="gpt-3.5-turbo", api_base="http://mock-openai-api.com")
-        mock_sentiment_analyzer_class.assert_called_once_with(api_key="test_llm_api_key", model="gpt-3.5-turbo", api_base="http://mock-openai-api.com")
+        mock_summarizer_instance.summarize_async.assert_called_once_with(mock_news_item.processed_content, "short")
+        mock_sentiment_analyzer_instance.analyze_async.assert_called_once_with(mock_news_item.processed_content)
+        mock_summarizer_class.assert_called_once_with(api_key="test_llm_api_key", model="gpt-3.5-turbo", api_base="http://mock-openai-api.com", http_client=main._openai_http_client)
+        mock_sentiment_analyzer_class.assert_called_once_with(api_key="test_llm_api_key", model="gpt-3.5-turbo", api_base="http://mock-openai-api.com", http_client=main._openai_http_client)
 
-@patch('main.NewsClient')
+@patch('main.NewsClient', autospec=True)
 @patch('main.os.getenv')
 def test_analyze_news_url_fetch_failure(mock_os_getenv, mock_news_client_class):
     mock_news_client_instance = mock_news_client_class.return_value
@@ -225,19 +240,21 @@ def test_analyze_news_url_fetch_failure(mock_os_getenv, mock_news_client_class):
     assert response.status_code == 400
     assert response.json() == {"detail": "Could not fetch news content from the provided URL. Please check the URL or try another one."}
 
-@patch('main.NewsClient')
-@patch('main.GeminiSummarizer')
-@patch('main.GeminiSentimentAnalyzer')
+@patch('main.NewsClient', autospec=True)
+@patch('main.GeminiSummarizer', autospec=True)
+@patch('main.GeminiSentimentAnalyzer', autospec=True)
 def test_analyze_news_summarization_failure(mock_sentiment_analyzer_class, mock_summarizer_class, mock_news_client_class, mock_news_item, mock_env_vars):
     mock_news_client_instance = mock_news_client_class.return_value
     mock_news_client_instance.get_news_from_url.return_value = mock_news_item
 
     with patch('main.extract_and_clean', return_value=mock_news_item.processed_content):
         mock_summarizer_instance = mock_summarizer_class.return_value
-        mock_summarizer_instance.summarize.side_effect = SummarizerException("LLM summarization error")
+        mock_summarizer_instance.summarize_async = AsyncMock()
+        mock_summarizer_instance.summarize_async.side_effect = SummarizerException("LLM summarization error")
 
         mock_sentiment_analyzer_instance = mock_sentiment_analyzer_class.return_value
-        mock_sentiment_analyzer_instance.analyze.return_value = mock_news_item.sentiment # Still get sentiment
+        mock_sentiment_analyzer_instance.analyze_async = AsyncMock()
+        mock_sentiment_analyzer_instance.analyze_async.return_value = mock_news_item.sentiment # Still get sentiment
 
         request_payload = {"news_url": "http://test.com/news", "summary_length": "short"}
         response = client.post("/analyze", json=request_payload)
@@ -246,19 +263,21 @@ def test_analyze_news_summarization_failure(mock_sentiment_analyzer_class, mock_
         assert "Summarization failed: LLM summarization error" in response.json()["summary"] # Changed from 요약 실패
         assert response.json()["sentiment_label"] == mock_news_item.sentiment.label
 
-@patch('main.NewsClient')
-@patch('main.GeminiSummarizer')
-@patch('main.GeminiSentimentAnalyzer')
+@patch('main.NewsClient', autospec=True)
+@patch('main.GeminiSummarizer', autospec=True)
+@patch('main.GeminiSentimentAnalyzer', autospec=True)
 def test_analyze_news_sentiment_failure(mock_sentiment_analyzer_class, mock_summarizer_class, mock_news_client_class, mock_news_item, mock_env_vars):
     mock_news_client_instance = mock_news_client_class.return_value
     mock_news_client_instance.get_news_from_url.return_value = mock_news_item
 
     with patch('main.extract_and_clean', return_value=mock_news_item.processed_content):
         mock_summarizer_instance = mock_summarizer_class.return_value
-        mock_summarizer_instance.summarize.return_value = mock_news_item.summary # Still get summary
+        mock_summarizer_instance.summarize_async = AsyncMock()
+        mock_summarizer_instance.summarize_async.return_value = mock_news_item.summary # Still get summary
 
         mock_sentiment_analyzer_instance = mock_sentiment_analyzer_class.return_value
-        mock_sentiment_analyzer_instance.analyze.side_effect = SentimentException("LLM sentiment error")
+        mock_sentiment_analyzer_instance.analyze_async = AsyncMock()
+        mock_sentiment_analyzer_instance.analyze_async.side_effect = SentimentException("LLM sentiment error")
 
         request_payload = {"news_url": "http://test.com/news", "summary_length": "short"}
         response = client.post("/analyze", json=request_payload)
@@ -1,5 +1,8 @@
+import asyncio
+import time
+import orjson
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 import requests
 from bs4 import BeautifulSoup
 import os
@@ -11,9 +14,21 @@ from services.summarizer import GeminiSummarizer, SummarizerException
 from services.sentiment import GeminiSentimentAnalyzer, SentimentException, LIKERT_SCALE_LABELS
 from services.openai_summarizer import OpenAISummarizer
 from services.openai_sentiment import OpenAISentimentAnalyzer
+from services.batching import BatchingAnalyzer, BatchedSummarizer
+from services.bulk_analyzer import bulk_analyze
+from services.cache_backend import MemoryBackend, SqliteBackend, backend_from_env
+from services.semantic_cache import SemanticCache
+from services.rate_limiter import GeminiLimiter
+from services.combined_analyzer import (
+    CombinedAnalysisException,
+    GeminiCombinedAnalyzer,
+    OpenAICombinedAnalyzer,
+    _build_combined_prompt,
+    _parse_combined_output,
+)
 
 ### Fixtures ###
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_news_item_full():
     return NewsItem(
         title="Test Article Title",
@@ -25,7 +40,7 @@ def mock_news_item_full():
         processed_content="Test Article Title. This is the first paragraph of the article. This is the second paragraph."
     )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_news_item_no_content():
     return NewsItem(
         title="Title Only",
@@ -36,29 +51,17 @@ def mock_news_item_no_content():
         content=None
     )
 
-@pytest.fixture
-def mock_gemini_response_summary():
-    mock_response = MagicMock()
-    mock_part = MagicMock()
-    mock_part.text = """- Bullet point 1
+@pytest.fixture(scope="session")
+def mock_gemini_response_summary(make_gemini_response):
+    return make_gemini_response("""- Bullet point 1
 - Bullet point 2
-Conclusion: This is a conclusion."""
-    mock_response.parts = [mock_part]
-    mock_response.prompt_feedback = None
-    mock_response.candidates = [MagicMock(finish_reason='STOP')]
-    return mock_response
+Conclusion: This is a conclusion.""")
 
-@pytest.fixture
-def mock_gemini_response_sentiment():
-    mock_response = MagicMock()
-    mock_part = MagicMock()
-    mock_part.text = '{"score": 4}'
-    mock_response.parts = [mock_part]
-    mock_response.prompt_feedback = None
-    mock_response.candidates = [MagicMock(finish_reason='STOP')]
-    return mock_response
+@pytest.fixture(scope="session")
+def mock_gemini_response_sentiment(make_gemini_response):
+    return make_gemini_response('{"score": 4}')
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_openai_response_summary():
     mock_response = MagicMock()
     mock_response.choices = [MagicMock()]
@@ -67,13 +70,34 @@ def mock_openai_response_summary():
 Conclusion: Summary.""")
     return mock_response
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_openai_response_sentiment():
     mock_response = MagicMock()
     mock_response.choices = [MagicMock()]
     mock_response.choices[0].message = MagicMock(content='{"score": 4}')
     return mock_response
 
+@pytest.fixture(scope="module")
+def gemini_summarizer():
+    # Construction (genai.configure + model setup) is pure setup; share one
+    # instance per module instead of rebuilding it in every test.
+    return GeminiSummarizer(api_key="fake_key")
+
+@pytest.fixture(scope="module")
+def sentiment_analyzer():
+    return GeminiSentimentAnalyzer(api_key="fake_key")
+
+@pytest.fixture(autouse=True)
+def _fresh_gemini_caches(request):
+    # The shared analyzers keep their result caches between tests; clear them
+    # before each test that uses one so cache assertions stay isolated.
+    for name in ("gemini_summarizer", "sentiment_analyzer"):
+        if name in request.fixturenames:
+            analyzer = request.getfixturevalue(name)
+            analyzer._cache.clear()
+            if hasattr(analyzer, "_local_cache"):
+                analyzer._local_cache().clear()
+
 ### NewsClient Tests ###
 class TestNewsClient:
     def test_init(self):
@@ -82,11 +106,13 @@ class TestNewsClient:
         client_with_key = NewsClient(api_key="test_key")
         assert client_with_key.api_key == "test_key"
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_news_from_url_success(self, mock_get, mock_news_item_full):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = mock_news_item_full.content
+        mock_response.headers = {'Content-Type': 'text/html; charset=utf-8'}
+        mock_response.iter_content.return_value = [mock_news_item_full.content.encode('utf-8')]
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -98,19 +124,19 @@ class TestNewsClient:
         assert "first paragraph" in news_item.content
         mock_get.assert_called_once()
 
-    @patch('requests.get', side_effect=requests.exceptions.Timeout)
+    @patch('requests.Session.get', side_effect=requests.exceptions.Timeout)
     def test_get_news_from_url_timeout(self, mock_get):
         client = NewsClient()
         with pytest.raises(NewsAPIException, match="URL 요청 시간이 초과되었습니다"):
             client.get_news_from_url("http://example.com/timeout")
 
-    @patch('requests.get', side_effect=requests.exceptions.RequestException("Connection error"))
+    @patch('requests.Session.get', side_effect=requests.exceptions.RequestException("Connection error"))
     def test_get_news_from_url_connection_error(self, mock_get):
         client = NewsClient()
         with pytest.raises(NewsAPIException, match="URL 요청 실패"):
             client.get_news_from_url("http://example.com/connection-error")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_news_from_url_http_error(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 404
@@ -121,11 +147,13 @@ class TestNewsClient:
         with pytest.raises(NewsAPIException, match="URL 요청 실패"): # NewsAPIException will wrap HTTPError
             client.get_news_from_url("http://example.com/404")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_news_from_url_no_content_fallback(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = "<html><body></body></html>" # Empty body
+        mock_response.headers = {'Content-Type': 'text/html'}
+        mock_response.iter_content.return_value = [b"<html><body></body></html>"]
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -133,7 +161,7 @@ class TestNewsClient:
         news_item = client.get_news_from_url("http://example.com/empty")
         assert news_item is None # Should return None if content extraction fails
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_news_success(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -156,28 +184,18 @@ class TestNewsClient:
         with pytest.raises(NewsAPIException, match="NewsAPI 키가 제공되지 않아 뉴스 검색 기능을 사용할 수 없습니다."):
             client.get_news(keyword="test")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_news_429_retries(self, mock_get):
-        # First two calls fail with 429, third succeeds
-        mock_response_429 = MagicMock()
-        mock_response_429.status_code = 429
-        mock_response_429.raise_for_status.side_effect = requests.exceptions.HTTPError("429 Too Many Requests", response=mock_response_429)
-
-        mock_response_success = MagicMock()
-        mock_response_success.status_code = 200
-        mock_response_success.json.return_value = {"articles": [{"title": "Success", "url": "http://success.com", "source": {"name": "Src"}, "publishedAt": "2023-01-01T00:00:00Z"}]}
-        mock_response_success.raise_for_status.return_value = None
-
-        mock_get.side_effect = [mock_response_429, mock_response_429, mock_response_success]
-
+        # Retries live in the urllib3 adapter now, so a mocked Session.get
+        # cannot exercise them; assert the mounted Retry policy instead.
         client = NewsClient(api_key="test_api_key")
-        articles = client.get_news(keyword="retry_test")
-
-        assert mock_get.call_count == 3
-        assert len(articles) == 1
-        assert articles[0].title == "Success"
+        for prefix in ("http://", "https://"):
+            retries = client._session.get_adapter(prefix).max_retries
+            assert retries.total == 3
+            assert 429 in retries.status_forcelist
+            assert retries.respect_retry_after_header
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_news_empty_articles(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -246,10 +264,9 @@ class TestTextExtraction:
 
 ### Summarizer (Gemini) Tests ###
 class TestGeminiSummarizer:
-    @patch('google.generativeai.GenerativeModel.generate_content')
-    def test_summarize_success(self, mock_generate_content, mock_gemini_response_summary):
+    def test_summarize_success(self, mock_generate_content, mock_gemini_response_summary, gemini_summarizer):
         mock_generate_content.return_value = mock_gemini_response_summary
-        summarizer = GeminiSummarizer(api_key="fake_key")
+        summarizer = gemini_summarizer
         text = "Some long text to summarize."
         summary = summarizer.summarize(text, "short")
         assert "Bullet point 1" in summary
@@ -257,158 +274,99 @@ class TestGeminiSummarizer:
         mock_generate_content.assert_called_once()
         assert summarizer._cache[summarizer._generate_cache_key(text, "short")] == summary
 
-    @patch('google.generativeai.GenerativeModel.generate_content', side_effect=Exception("API error"))
-    def test_summarize_api_failure(self, mock_generate_content):
-        summarizer = GeminiSummarizer(api_key="fake_key")
+    def test_summarize_api_failure(self, mock_generate_content, gemini_summarizer):
+        mock_generate_content.side_effect = Exception("API error")
         with pytest.raises(SummarizerException, match="Failed to summarize text with Gemini API"):
-            summarizer.summarize("text", "medium")
+            gemini_summarizer.summarize("text", "medium")
 
-    def test_summarize_cache(self, mock_news_item_full):
-        # Mock generate_content only for the first call
-        with patch('google.generativeai.GenerativeModel.generate_content') as mock_gen_content:
-            mock_response = MagicMock()
-            mock_part = MagicMock()
-            mock_part.text = "- Cached Summary"
-            mock_response.parts = [mock_part]
-            mock_response.prompt_feedback = None
-            mock_response.candidates = [MagicMock(finish_reason='STOP')]
-            mock_gen_content.return_value = mock_response
-
-            summarizer = GeminiSummarizer(api_key="fake_key")
-            text = "Text for caching test"
-            summary1 = summarizer.summarize(text, "medium")
-            summary2 = summarizer.summarize(text, "medium")
+    def test_summarize_cache(self, mock_generate_content, mock_news_item_full, make_gemini_response, gemini_summarizer):
+        mock_generate_content.return_value = make_gemini_response("- Cached Summary")
 
-            mock_gen_content.assert_called_once() # Should only call API once
-            assert summary1 == summary2
-            assert "- Cached Summary" in summary1
+        text = "Text for caching test"
+        summary1 = gemini_summarizer.summarize(text, "medium")
+        summary2 = gemini_summarizer.summarize(text, "medium")
 
-    def test_summarize_empty_text(self):
-        summarizer = GeminiSummarizer(api_key="fake_key")
-        summary = summarizer.summarize("", "short")
-        assert summary == "요약할 내용이 없습니다."
+        mock_generate_content.assert_called_once() # Should only call API once
+        assert summary1 == summary2
+        assert "- Cached Summary" in summary1
 
-    @patch('google.generativeai.GenerativeModel.generate_content')
-    def test_summarize_prompt_blocked(self, mock_generate_content):
-        mock_response = MagicMock()
-        mock_response.parts = []
-        mock_response.prompt_feedback = MagicMock(block_reason='SAFETY')
-        mock_generate_content.return_value = mock_response
+    def test_summarize_empty_text(self, gemini_summarizer):
+        summary = gemini_summarizer.summarize("", "short")
+        assert summary == "요약할 내용이 없습니다."
 
-        summarizer = GeminiSummarizer(api_key="fake_key")
+    def test_summarize_prompt_blocked(self, mock_generate_content, make_gemini_response, gemini_summarizer):
+        mock_generate_content.return_value = make_gemini_response(block_reason='SAFETY')
         with pytest.raises(SummarizerException, match="프롬프트가 안전성 정책에 의해 차단되었습니다"):
-            summarizer.summarize("harmful text", "short")
-
-    @patch('google.generativeai.GenerativeModel.generate_content')
-    def test_summarize_candidate_blocked(self, mock_generate_content):
-        mock_response = MagicMock()
-        mock_response.parts = []
-        mock_response.prompt_feedback = None
-        mock_response.candidates = [MagicMock(finish_reason='SAFETY')]
-        mock_generate_content.return_value = mock_response
+            gemini_summarizer.summarize("harmful text", "short")
 
-        summarizer = GeminiSummarizer(api_key="fake_key")
+    def test_summarize_candidate_blocked(self, mock_generate_content, make_gemini_response, gemini_summarizer):
+        mock_generate_content.return_value = make_gemini_response(finish_reason='SAFETY')
         with pytest.raises(SummarizerException, match="요약 결과가 안전성 정책에 의해 차단되었습니다"):
-            summarizer.summarize("text", "short")
+            gemini_summarizer.summarize("text", "short")
 
 
 ### Sentiment (Gemini) Tests ###
 class TestGeminiSentimentAnalyzer:
-    @patch('google.generativeai.GenerativeModel.generate_content')
-    def test_analyze_success(self, mock_generate_content, mock_gemini_response_sentiment):
+    def test_analyze_success(self, mock_generate_content, mock_gemini_response_sentiment, sentiment_analyzer):
         mock_generate_content.return_value = mock_gemini_response_sentiment
-        analyzer = GeminiSentimentAnalyzer(api_key="fake_key")
-        text = "This is a positive text."
+        analyzer = sentiment_analyzer
+        text = "This is a positive text, long enough to be worth caching. " * 8
         sentiment = analyzer.analyze(text)
         assert sentiment.label == LIKERT_SCALE_LABELS[4]
         assert sentiment.score == 4.0
         mock_generate_content.assert_called_once()
         assert analyzer._cache[analyzer._generate_cache_key(text)] == sentiment
 
-    @patch('google.generativeai.GenerativeModel.generate_content', side_effect=Exception("API error"))
-    def test_analyze_api_failure_fallback_neutral(self, mock_generate_content):
-        analyzer = GeminiSentimentAnalyzer(api_key="fake_key")
-        sentiment = analyzer.analyze("text")
+    def test_analyze_api_failure_fallback_neutral(self, mock_generate_content, sentiment_analyzer):
+        mock_generate_content.side_effect = Exception("API error")
+        sentiment = sentiment_analyzer.analyze("text")
         assert sentiment.label == LIKERT_SCALE_LABELS[3]
         assert sentiment.score == 3.0
 
-    def test_analyze_cache(self):
-        with patch('google.generativeai.GenerativeModel.generate_content') as mock_gen_content:
-            mock_response = MagicMock()
-            mock_part = MagicMock()
-            mock_part.text = '{"score": 5}'
-            mock_response.parts = [mock_part]
-            mock_response.prompt_feedback = None
-            mock_response.candidates = [MagicMock(finish_reason='STOP')]
-            mock_gen_content.return_value = mock_response
-
-            analyzer = GeminiSentimentAnalyzer(api_key="fake_key")
-            text = "Cache test text."
-            sentiment1 = analyzer.analyze(text)
-            sentiment2 = analyzer.analyze(text)
+    def test_analyze_cache(self, mock_generate_content, make_gemini_response, sentiment_analyzer):
+        mock_generate_content.return_value = make_gemini_response('{"score": 5}')
 
-            mock_gen_content.assert_called_once()
-            assert sentiment1.score == 5.0
-            assert sentiment1 == sentiment2
+        text = "Cache test text, long enough to be worth caching. " * 8
+        sentiment1 = sentiment_analyzer.analyze(text)
+        sentiment2 = sentiment_analyzer.analyze(text)
 
-    def test_analyze_empty_text_fallback_neutral(self):
-        analyzer = GeminiSentimentAnalyzer(api_key="fake_key")
-        sentiment = analyzer.analyze("")
-        assert sentiment.label == LIKERT_SCALE_LABELS[3]
-        assert sentiment.score == 3.0
+        mock_generate_content.assert_called_once()
+        assert sentiment1.score == 5.0
+        assert sentiment1 == sentiment2
 
-    @patch('google.generativeai.GenerativeModel.generate_content')
-    def test_analyze_invalid_json_output_fallback_neutral(self, mock_generate_content):
-        mock_response = MagicMock()
-        mock_part = MagicMock()
-        mock_part.text = '{"invalid_json": "no_score"}'
-        mock_response.parts = [mock_part]
-        mock_response.prompt_feedback = None
-        mock_response.candidates = [MagicMock(finish_reason='STOP')]
-        mock_generate_content.return_value = mock_response
-
-        analyzer = GeminiSentimentAnalyzer(api_key="fake_key")
-        sentiment = analyzer.analyze("text")
+    def test_analyze_empty_text_fallback_neutral(self, sentiment_analyzer):
+        sentiment = sentiment_analyzer.analyze("")
         assert sentiment.label == LIKERT_SCALE_LABELS[3]
         assert sentiment.score == 3.0
 
-    @patch('google.generativeai.GenerativeModel.generate_content')
-    def test_analyze_non_json_output_fallback_neutral(self, mock_generate_content):
-        mock_response = MagicMock()
-        mock_part = MagicMock()
-        mock_part.text = 'Not a JSON output.'
-        mock_response.parts = [mock_part]
-        mock_response.prompt_feedback = None
-        mock_response.candidates = [MagicMock(finish_reason='STOP')]
-        mock_generate_content.return_value = mock_response
-
-        analyzer = GeminiSentimentAnalyzer(api_key="fake_key")
-        sentiment = analyzer.analyze("text")
+    def test_analyze_batch(self, mock_generate_content, make_gemini_response, sentiment_analyzer):
+        mock_generate_content.return_value = make_gemini_response('[{"id": 0, "score": 5}, {"id": 1, "score": 1}]')
+        analyzer = sentiment_analyzer
+        text_a = "Great news, everyone is thrilled. " * 10
+        text_b = "Terrible news, everyone is upset. " * 10
+        # 중복 텍스트는 한 번만 계산되고 같은 결과를 공유해야 한다
+        results = analyzer.analyze_batch([text_a, text_b, text_a, ""])
+
+        mock_generate_content.assert_called_once()
+        assert [r.score for r in results] == [5.0, 1.0, 5.0, 3.0]
+        assert analyzer._cache[analyzer._generate_cache_key(text_a)] == results[0]
+
+    @pytest.mark.parametrize("payload", ['{"invalid_json": "no_score"}', 'Not a JSON output.'])
+    def test_analyze_malformed_output_fallback_neutral(self, mock_generate_content, payload, make_gemini_response, sentiment_analyzer):
+        mock_generate_content.return_value = make_gemini_response(payload)
+        sentiment = sentiment_analyzer.analyze("text")
         assert sentiment.label == LIKERT_SCALE_LABELS[3]
         assert sentiment.score == 3.0
     
-    @patch('google.generativeai.GenerativeModel.generate_content')
-    def test_analyze_prompt_blocked(self, mock_generate_content):
-        mock_response = MagicMock()
-        mock_response.parts = []
-        mock_response.prompt_feedback = MagicMock(block_reason='SAFETY')
-        mock_generate_content.return_value = mock_response
-
-        analyzer = GeminiSentimentAnalyzer(api_key="fake_key")
+    def test_analyze_prompt_blocked(self, mock_generate_content, make_gemini_response, sentiment_analyzer):
+        mock_generate_content.return_value = make_gemini_response(block_reason='SAFETY')
         with pytest.raises(SentimentException, match="프롬프트가 안전성 정책에 의해 차단되었습니다"):
-            analyzer.analyze("harmful text")
+            sentiment_analyzer.analyze("harmful text")
     
-    @patch('google.generativeai.GenerativeModel.generate_content')
-    def test_analyze_candidate_blocked(self, mock_generate_content):
-        mock_response = MagicMock()
-        mock_response.parts = []
-        mock_response.prompt_feedback = None
-        mock_response.candidates = [MagicMock(finish_reason='SAFETY')]
-        mock_generate_content.return_value = mock_response
-
-        analyzer = GeminiSentimentAnalyzer(api_key="fake_key")
+    def test_analyze_candidate_blocked(self, mock_generate_content, make_gemini_response, sentiment_analyzer):
+        mock_generate_content.return_value = make_gemini_response(finish_reason='SAFETY')
         with pytest.raises(SentimentException, match="감성 분석 결과가 안전성 정책에 의해 차단되었습니다"):
-            analyzer.analyze("text")
+            sentiment_analyzer.analyze("text")
 
 
 ### Summarizer (OpenAI) Tests ###
@@ -419,7 +377,7 @@ class TestOpenAISummarizer:
         mock_openai_instance.chat.completions.create.return_value = mock_openai_response_summary
 
         summarizer = OpenAISummarizer(api_key="fake_key")
-        text = "Some text to summarize."
+        text = "Some text to summarize, long enough to be worth caching. " * 8
         summary = summarizer.summarize(text, "short")
         assert "Bullet 1" in summary
         mock_openai_instance.chat.completions.create.assert_called_once()
@@ -437,7 +395,7 @@ class TestOpenAISummarizer:
             mock_openai_instance.chat.completions.create.return_value = MagicMock(choices=[MagicMock(message=MagicMock(content="- Cached OpenAI Summary"))])
 
             summarizer = OpenAISummarizer(api_key="fake_key")
-            text = "Text for OpenAI caching test"
+            text = "Text for OpenAI caching test, long enough to be worth caching. " * 8
             summary1 = summarizer.summarize(text, "medium")
             summary2 = summarizer.summarize(text, "medium")
 
@@ -495,22 +453,356 @@ class TestOpenAISentimentAnalyzer:
         assert sentiment.label == LIKERT_SCALE_LABELS[3]
         assert sentiment.score == 3.0
 
+    @pytest.mark.parametrize("payload", ['{"invalid_json": "no_score"}', 'Not a JSON output.'])
     @patch('openai.OpenAI')
-    def test_analyze_invalid_json_output_fallback_neutral(self, mock_openai_class):
+    def test_analyze_malformed_output_fallback_neutral(self, mock_openai_class, payload):
         mock_openai_instance = mock_openai_class.return_value
-        mock_openai_instance.chat.completions.create.return_value = MagicMock(choices=[MagicMock(message=MagicMock(content='{"invalid_json": "no_score"}'))])
-        
+        mock_openai_instance.chat.completions.create.return_value = MagicMock(choices=[MagicMock(message=MagicMock(content=payload))])
+
         analyzer = OpenAISentimentAnalyzer(api_key="fake_key")
         sentiment = analyzer.analyze("text")
         assert sentiment.label == LIKERT_SCALE_LABELS[3]
         assert sentiment.score == 3.0
-    
+
+### Batching Tests ###
+class TestBatchingAnalyzer:
+    def _mock_client(self, content: str) -> MagicMock:
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(
+            return_value=MagicMock(choices=[MagicMock(message=MagicMock(content=content))]))
+        return client
+
+    def test_init_requires_api_key(self):
+        with pytest.raises(ValueError):
+            BatchingAnalyzer(api_key="")
+
+    def test_submit_coalesces_concurrent_requests(self):
+        analyzer = BatchingAnalyzer(api_key="fake_key")
+        analyzer._async_client = self._mock_client(
+            '{"results": [{"id": 0, "summary": "- A", "score": 5}, {"id": 1, "summary": "- B", "score": 1}]}')
+
+        async def run():
+            return await asyncio.gather(
+                analyzer.submit("Happy news. " * 10),
+                analyzer.submit("Sad news. " * 10),
+            )
+
+        (summary_a, sentiment_a), (summary_b, sentiment_b) = asyncio.run(run())
+        assert summary_a == "- A"
+        assert sentiment_a.score == 5.0
+        assert summary_b == "- B"
+        assert sentiment_b.score == 1.0
+        analyzer._async_client.chat.completions.create.assert_called_once()
+
+    def test_submit_after_idle_worker_exit(self):
+        # The worker exits once its window drains; a later submit must get a
+        # fresh worker instead of hanging on the dead task (handoff race).
+        analyzer = BatchingAnalyzer(api_key="fake_key")
+        analyzer._async_client = self._mock_client('{"summary": "- S", "score": 4}')
+
+        async def run():
+            first = await analyzer.submit("First article. " * 10)
+            await asyncio.sleep(analyzer.BATCH_WINDOW_SECONDS * 3)
+            second = await asyncio.wait_for(analyzer.submit("Second article. " * 10), timeout=2.0)
+            return first, second
+
+        (summary1, _), (summary2, _) = asyncio.run(run())
+        assert summary1 == "- S"
+        assert summary2 == "- S"
+
+    def test_submit_failure_propagates(self):
+        analyzer = BatchingAnalyzer(api_key="fake_key")
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(side_effect=Exception("API error"))
+        analyzer._async_client = client
+        with pytest.raises(CombinedAnalysisException):
+            asyncio.run(analyzer.submit("text"))
+
+
+class TestBatchedSummarizer:
+    def test_submit_coalesces_into_one_gemini_call(self, make_gemini_response):
+        summarizer = GeminiSummarizer(api_key="fake_key")
+        batched = BatchedSummarizer(summarizer)
+        response = make_gemini_response('{"results": [{"id": 0, "summary": "- A"}, {"id": 1, "summary": "- B"}]}')
+        with patch.object(summarizer.model, 'generate_content_async',
+                          new=AsyncMock(return_value=response)) as mock_gen:
+            async def run():
+                return await asyncio.gather(
+                    batched.submit("First article. " * 10),
+                    batched.submit("Second article. " * 10),
+                )
+            summaries = asyncio.run(run())
+        assert summaries == ["- A", "- B"]
+        mock_gen.assert_called_once()
+
+    def test_submit_returns_cached_without_call(self, make_gemini_response):
+        summarizer = GeminiSummarizer(api_key="fake_key")
+        batched = BatchedSummarizer(summarizer)
+        text = "Cached article. " * 10
+        summarizer._store_summary(text, "medium", "- Cached")
+        with patch.object(summarizer.model, 'generate_content_async', new=AsyncMock()) as mock_gen:
+            summary = asyncio.run(batched.submit(text, "medium"))
+        assert summary == "- Cached"
+        mock_gen.assert_not_called()
+
+
+### Bulk Analyzer Tests ###
+class TestBulkAnalyzer:
+    def _make_item(self, processed_content=None):
+        return NewsItem(
+            title="Bulk Item",
+            description="Desc",
+            url="http://bulk.com",
+            source_name="Bulk Source",
+            published_at="2023-01-01T00:00:00Z",
+            content="Content",
+            processed_content=processed_content,
+        )
+
+    def _make_client(self, status: str, output: bytes) -> MagicMock:
+        client = MagicMock()
+        client.files.create.return_value = MagicMock(id="file-in")
+        client.batches.create.return_value = MagicMock(id="batch-1", status=status, output_file_id="file-out")
+        client.files.content.return_value = MagicMock(content=output)
+        return client
+
+    def test_bulk_analyze_requires_api_key(self):
+        with pytest.raises(ValueError):
+            bulk_analyze([self._make_item("text")], api_key="")
+
     @patch('openai.OpenAI')
-    def test_analyze_non_json_output_fallback_neutral(self, mock_openai_class):
-        mock_openai_instance = mock_openai_class.return_value
-        mock_openai_instance.chat.completions.create.return_value = MagicMock(choices=[MagicMock(message=MagicMock(content='Not a JSON output.'))])
+    def test_bulk_analyze_skips_items_without_content(self, mock_openai_class):
+        items = [self._make_item(processed_content=None)]
+        assert bulk_analyze(items, api_key="fake_key") is items
+        mock_openai_class.assert_not_called()
 
-        analyzer = OpenAISentimentAnalyzer(api_key="fake_key")
-        sentiment = analyzer.analyze("text")
-        assert sentiment.label == LIKERT_SCALE_LABELS[3]
-        assert sentiment.score == 3.0
+    @patch('openai.OpenAI')
+    def test_bulk_analyze_merges_results(self, mock_openai_class):
+        rows = [
+            {"custom_id": "0",
+             "response": {"status_code": 200,
+                          "body": {"choices": [{"message": {"content": '{"summary": "- Bulk", "score": 5}'}}]}}},
+            # 실패한 행은 병합에서 제외되고 해당 항목은 None으로 남는다
+            {"custom_id": "1", "error": {"message": "boom"}, "response": {"status_code": 500}},
+        ]
+        output = b"\n".join(orjson.dumps(row) for row in rows)
+        mock_openai_class.return_value = self._make_client("completed", output)
+
+        items = [self._make_item("First processed content."), self._make_item("Second processed content.")]
+        result = bulk_analyze(items, api_key="fake_key", poll_interval=0)
+
+        assert result[0].summary == "- Bulk"
+        assert result[0].sentiment.score == 5.0
+        assert result[1].summary is None
+        assert result[1].sentiment is None
+
+    @patch('openai.OpenAI')
+    def test_bulk_analyze_failed_batch_raises(self, mock_openai_class):
+        mock_openai_class.return_value = self._make_client("failed", b"")
+        with pytest.raises(CombinedAnalysisException, match="ended with status"):
+            bulk_analyze([self._make_item("Some processed content.")], api_key="fake_key", poll_interval=0)
+
+
+### Cache Backend Tests ###
+class TestCacheBackend:
+    def test_memory_backend_roundtrip(self):
+        backend = MemoryBackend(maxsize=4, ttl=60)
+
+        async def run():
+            assert await backend.get("k") is None
+            await backend.set("k", "v")
+            assert await backend.get("k") == "v"
+            await backend.delete("k")
+            assert await backend.get("k") is None
+
+        asyncio.run(run())
+
+    def test_sqlite_backend_roundtrip(self, tmp_path):
+        backend = SqliteBackend(str(tmp_path / "cache.db"))
+
+        async def run():
+            await backend.set("k", "v", ttl=60)
+            assert await backend.get("k") == "v"
+            await backend.delete("k")
+            assert await backend.get("k") is None
+
+        asyncio.run(run())
+
+    def test_sqlite_backend_expires_entries(self, tmp_path):
+        backend = SqliteBackend(str(tmp_path / "cache.db"))
+
+        async def run():
+            await backend.set("k", "v", ttl=-1)  # 이미 만료된 항목
+            assert await backend.get("k") is None
+
+        asyncio.run(run())
+
+    def test_sqlite_backend_persists_across_connections(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+
+        async def run():
+            await SqliteBackend(path).set("k", "v", ttl=60)
+            assert await SqliteBackend(path).get("k") == "v"
+
+        asyncio.run(run())
+
+    def test_backend_from_env_defaults_to_memory(self, monkeypatch):
+        monkeypatch.delenv("REDIS_URL", raising=False)
+        monkeypatch.delenv("DISK_CACHE_PATH", raising=False)
+        assert isinstance(backend_from_env(), MemoryBackend)
+
+    def test_backend_from_env_selects_sqlite(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("REDIS_URL", raising=False)
+        monkeypatch.setenv("DISK_CACHE_PATH", str(tmp_path / "cache.db"))
+        assert isinstance(backend_from_env(), SqliteBackend)
+
+
+### Combined Analyzer Tests ###
+class TestCombinedAnalyzer:
+    def test_build_combined_prompt_embeds_text_and_length(self):
+        prompt = _build_combined_prompt("Some article body.", "short")
+        assert "Some article body." in prompt
+        assert GeminiSummarizer.LENGTH_PROMPTS["short"] in prompt
+
+    def test_parse_combined_output_valid(self):
+        summary, sentiment = _parse_combined_output('{"summary": "- S", "score": 4}')
+        assert summary == "- S"
+        assert sentiment.label == LIKERT_SCALE_LABELS[4]
+        assert sentiment.score == 4.0
+
+    def test_parse_combined_output_clamps_score(self):
+        _, sentiment = _parse_combined_output('{"summary": "- S", "score": 9}')
+        assert sentiment.score == 5.0
+
+    def test_parse_combined_output_trims_surrounding_text(self):
+        raw = 'Here you go: {"summary": "- S", "score": 2} hope it helps'
+        summary, sentiment = _parse_combined_output(raw)
+        assert summary == "- S"
+        assert sentiment.score == 2.0
+
+    def test_parse_combined_output_invalid_raises(self):
+        with pytest.raises(CombinedAnalysisException):
+            _parse_combined_output('{"summary": "", "score": 3}')
+
+    def test_openai_analyze_async_caches(self):
+        analyzer = OpenAICombinedAnalyzer(api_key="fake_key")
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(return_value=MagicMock(
+            choices=[MagicMock(message=MagicMock(content='{"summary": "- S", "score": 4}'))]))
+        analyzer._async_client = client
+
+        async def run():
+            first = await analyzer.analyze_async("Some article text.")
+            second = await analyzer.analyze_async("Some article text.")
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == second
+        assert first[0] == "- S"
+        client.chat.completions.create.assert_called_once()
+
+    def test_gemini_analyze_async_call_failure(self):
+        analyzer = GeminiCombinedAnalyzer(api_key="fake_key")
+        with patch.object(analyzer.model, 'generate_content_async',
+                          new=AsyncMock(side_effect=Exception("API error"))):
+            with pytest.raises(CombinedAnalysisException, match="Gemini"):
+                asyncio.run(analyzer.analyze_async("Unique gemini combined text."))
+
+
+### Semantic Cache Tests ###
+class TestSemanticCache:
+    def test_get_returns_similar_entry(self):
+        vectors = {
+            "the cat sat": [1.0, 0.0, 0.0],
+            "a cat sat down": [0.98, 0.2, 0.0],
+            "stock market news": [0.0, 1.0, 0.0],
+        }
+        cache = SemanticCache(embed_fn=vectors.__getitem__, threshold=0.9)
+        cache.put("the cat sat", "summary-cat")
+        cache.put("stock market news", "summary-stock")
+
+        assert cache.get("a cat sat down") == "summary-cat"
+        assert cache.get("stock market news") == "summary-stock"
+
+    def test_get_below_threshold_misses(self):
+        vectors = {"a": [1.0, 0.0], "b": [0.0, 1.0]}
+        cache = SemanticCache(embed_fn=vectors.__getitem__, threshold=0.9)
+        cache.put("a", "va")
+        assert cache.get("b") is None
+
+    def test_namespaces_are_isolated(self):
+        vectors = {"t": [1.0, 0.0]}
+        cache = SemanticCache(embed_fn=vectors.__getitem__)
+        cache.put("t", "short-sum", namespace="short")
+        assert cache.get("t", namespace="long") is None
+        assert cache.get("t", namespace="short") == "short-sum"
+
+    def test_embedding_failure_disables_cache(self):
+        def broken_embed(text):
+            raise RuntimeError("embedding API unavailable")
+
+        cache = SemanticCache(embed_fn=broken_embed)
+        cache.put("a", "va")
+        assert cache.get("a") is None
+        assert cache._disabled
+
+    def test_max_entries_evicts_oldest(self):
+        vectors = {"a": [1.0, 0.0], "b": [0.0, 1.0], "c": [0.7, 0.7]}
+        cache = SemanticCache(embed_fn=vectors.__getitem__, threshold=0.99, max_entries=2)
+        cache.put("a", "va")
+        cache.put("b", "vb")
+        cache.put("c", "vc")
+
+        assert cache.get("a") is None  # 가장 오래된 항목은 퇴출됨
+        assert cache.get("b") == "vb"
+
+
+### Rate Limiter Tests ###
+class TestGeminiLimiter:
+    def test_safety_margin_shrinks_quotas(self):
+        limiter = GeminiLimiter(rpm=30, tpm=1_000_000, rpd=1500, safety_margin=0.8)
+        assert limiter.rpm == 24
+        assert limiter.tpm == 800_000
+        assert limiter.rpd == 1200
+
+    def test_acquire_under_quota_does_not_wait(self):
+        limiter = GeminiLimiter(rpm=10, tpm=1000, rpd=100, safety_margin=1.0)
+
+        async def run():
+            start = time.monotonic()
+            for _ in range(3):
+                await limiter.acquire(10)
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) < 0.5
+        assert len(limiter._requests) == 3
+        assert limiter._token_total == 30
+
+    def test_rpm_limit_computes_wait(self):
+        limiter = GeminiLimiter(rpm=2, safety_margin=1.0)
+        now = time.monotonic()
+        limiter._requests.extend([now, now])
+        assert limiter._wait_time(now, 0) == pytest.approx(60, abs=1)
+
+    def test_tpm_limit_computes_wait(self):
+        limiter = GeminiLimiter(tpm=100, safety_margin=1.0)
+        now = time.monotonic()
+        limiter._tokens.append((now, 90))
+        limiter._token_total = 90
+        assert limiter._wait_time(now, 20) == pytest.approx(60, abs=1)
+        assert limiter._wait_time(now, 5) == 0.0
+
+    def test_prune_drops_expired_entries(self):
+        limiter = GeminiLimiter()
+        now = time.monotonic()
+        old = now - 120  # 분 윈도우는 지났지만 일 윈도우 안
+        limiter._requests.append(old)
+        limiter._tokens.append((old, 50))
+        limiter._token_total = 50
+        limiter._daily.append(old)
+
+        limiter._prune(now)
+        assert not limiter._requests
+        assert not limiter._tokens
+        assert limiter._token_total == 0
+        assert len(limiter._daily) == 1
@@ -11,13 +11,20 @@ interface ResultDisplayProps {
     result: AnalysisResult;
 }
 
-const ResultDisplay = ({ result }: ResultDisplayProps) => {
-  const getSentimentColor = (score: number) => {
-    if (score >= 4) return 'text-green-600'; // 긍정
-    if (score <= 2) return 'text-red-600';   // 부정
-    return 'text-yellow-600';               // 중립
-  };
+// 리커트 점수(1-5)별 색상 클래스. 렌더링마다 함수를 새로 만들지 않도록
+// 모듈 수준에서 한 번만 정의한 조회 테이블을 사용합니다.
+const SENTIMENT_COLORS: Record<number, string> = {
+  1: 'text-red-600',    // 부정
+  2: 'text-red-600',
+  3: 'text-yellow-600', // 중립
+  4: 'text-green-600',  // 긍정
+  5: 'text-green-600',
+};
 
+const getSentimentColor = (score: number) =>
+  SENTIMENT_COLORS[Math.round(score)] ?? 'text-yellow-600';
+
+const ResultDisplay = ({ result }: ResultDisplayProps) => {
   return (
     <div className="space-y-4">
       <h2 className="text-2xl font-bold text-gray-800">{result.title}</h2>